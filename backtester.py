@@ -7,12 +7,145 @@ Tests the quant screener strategy on historical data.
 Simulates daily stock picking and tracks performance vs market.
 """
 
-import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 import pandas as pd
 import numpy as np
+import orjson
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels run as plain Python without it
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+def _calendar_dates(index) -> pd.DatetimeIndex:
+    """Normalize an index to tz-naive midnight timestamps for date lookups"""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize()
+
+
+def _aligned_closes(df: pd.DataFrame, dates: pd.DatetimeIndex, dtype=np.float64) -> np.ndarray:
+    """Close prices aligned to dates (NaN where missing)"""
+    if len(df) == 0:
+        return np.full(len(dates), np.nan, dtype=dtype)
+    
+    closes = df['close'].to_numpy(dtype=dtype)
+    rows = _calendar_dates(df.index).get_indexer(dates)
+    return np.where(rows >= 0, closes[rows], np.nan)
+
+
+def _equal_weight_returns(closes: np.ndarray) -> np.ndarray:
+    """
+    Equal-weight daily % return of a [n_dates, n_stocks] close matrix.
+    
+    Stocks missing a price (NaN) or with a non-positive close on either day
+    are left out of that day's average; days with no usable stock are NaN.
+    Per-stock returns keep the dtype of closes, the average is float64.
+    """
+    curr = closes[:-1]
+    nxt = closes[1:]
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = (nxt / curr - 1) * 100
+    
+    valid = (curr > 0) & ~np.isnan(nxt)
+    counts = valid.sum(axis=1)
+    totals = np.where(valid, returns, 0).sum(axis=1, dtype=np.float64)
+    
+    return np.divide(totals, counts, out=np.full(len(counts), np.nan), where=counts > 0)
+
+
+def _max_drawdown_pct(equity_curve) -> float:
+    """Largest peak-to-trough decline of an equity curve, in percent"""
+    equity = np.asarray(equity_curve, dtype=np.float64)
+    peaks = np.maximum.accumulate(equity)
+    return float(((peaks - equity) / peaks).max() * 100)
+
+
+@njit(cache=True)
+def _compound_equity(initial_capital, portfolio_returns, market_returns):
+    """
+    Compound daily % returns into portfolio and market equity curves.
+    
+    NaN returns leave the value unchanged for that day. Both curves start
+    at initial_capital and have one more point than the return arrays.
+    """
+    n = len(portfolio_returns)
+    equity = np.empty(n + 1)
+    market = np.empty(n + 1)
+    equity[0] = initial_capital
+    market[0] = initial_capital
+    
+    for i in range(n):
+        r = portfolio_returns[i]
+        equity[i + 1] = equity[i] if np.isnan(r) else equity[i] * (1 + r / 100)
+        m = market_returns[i]
+        market[i + 1] = market[i] if np.isnan(m) else market[i] * (1 + m / 100)
+    
+    return equity, market
+
+
+def _scan_shard(screener, shard: dict, market_data: pd.DataFrame) -> list:
+    """Worker entry point: scan one subset of the universe"""
+    return screener.scan_universe(shard, market_data)
+
+
+def _parallel_scan(executor: ProcessPoolExecutor, n_jobs: int, screener,
+                   screening_data: dict, market_data: pd.DataFrame) -> list:
+    """
+    Scan the universe in n_jobs contiguous symbol shards and merge the results.
+    
+    Stocks are scored independently, so concatenating the shards in order and
+    re-sorting gives the same ranking as a single scan_universe call.
+    """
+    items = list(screening_data.items())
+    shard_size = -(-len(items) // n_jobs)
+    futures = [
+        executor.submit(_scan_shard, screener, dict(items[start:start + shard_size]), market_data)
+        for start in range(0, len(items), shard_size)
+    ]
+    
+    results = []
+    for future in futures:
+        results.extend(future.result())
+    results.sort(key=lambda x: x['composite_score'], reverse=True)
+    return results
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> tuple:
+    """Length, last date and last close: enough to notice appended or replaced bars"""
+    if len(df) == 0:
+        return (0,)
+    return len(df), df.index[-1], float(df['close'].iloc[-1])
+
+
+def _scan_cache_key(stock_data: dict, market_data: pd.DataFrame, screener) -> tuple:
+    """
+    Key for reusing screener results across backtests, built from the data
+    and the screener's settings rather than object identities.
+    """
+    # market_returns is per-scan state, set from market_data on each call
+    signals = repr([
+        (type(signal).__name__, sorted((k, v) for k, v in vars(signal).items()
+                                       if k != 'market_returns' and not isinstance(v, np.ndarray)))
+        for signal in getattr(screener, 'signals', ())
+    ])
+    return (
+        tuple((symbol, _frame_fingerprint(df)) for symbol, df in stock_data.items()),
+        _frame_fingerprint(market_data),
+        type(screener).__name__,
+        getattr(screener, 'required_lookback', None),
+        getattr(screener, 'panel_dtype', None),
+        signals,
+    )
 
 
 class Backtester:
@@ -24,13 +157,21 @@ class Backtester:
         self.initial_capital = initial_capital
         self.num_picks = num_picks
         self.results = None
+        
+        # Screener results per rebalance date, reused by run_backtest(...,
+        # reuse_scans=True) when the same data is backtested again (e.g.
+        # sweeping num_picks)
+        self._scan_cache = {}
+        self._scan_cache_key = None
     
     def run_backtest(self, stock_data: Dict[str, pd.DataFrame], 
                      market_data: pd.DataFrame,
                      screener, 
                      start_date: str = None,
                      end_date: str = None,
-                     rebalance_days: int = 1) -> dict:
+                     rebalance_days: int = 1,
+                     n_jobs: int = 1,
+                     reuse_scans: bool = False) -> dict:
         """
         Run backtest on historical data.
         
@@ -41,135 +182,190 @@ class Backtester:
             start_date: Start date (YYYY-MM-DD), default 6 months ago
             end_date: End date (YYYY-MM-DD), default today
             rebalance_days: Days between rebalancing (1 = daily)
+            n_jobs: Worker processes for screening on rebalance days (1 = serial)
+            reuse_scans: Reuse screener results from an earlier run on this
+                Backtester when the stock data (length, last date and last
+                close per symbol), market data and screener settings match
         
         Returns:
             Dict with backtest results
         """
         
-        # Get common dates across all stocks
-        all_dates = set()
-        for symbol, df in stock_data.items():
-            if len(df) > 0:
-                all_dates.update(df.index.strftime('%Y-%m-%d').tolist())
+        # Get common dates across all stocks (sorted, unique datetime64 values)
+        date_arrays = [_calendar_dates(df.index).values for df in stock_data.values() if len(df) > 0]
         
-        if not all_dates:
+        if not date_arrays:
             return {'error': 'No data available'}
         
-        sorted_dates = sorted(list(all_dates))
+        sorted_dates = pd.DatetimeIndex(np.unique(np.concatenate(date_arrays)))
         
         # Set date range
         if start_date is None:
             start_idx = max(0, len(sorted_dates) - 126)  # ~6 months
         else:
-            start_idx = next((i for i, d in enumerate(sorted_dates) if d >= start_date), 0)
+            start_idx = int(sorted_dates.searchsorted(pd.Timestamp(start_date)))
+            if start_idx == len(sorted_dates):
+                start_idx = 0
         
         if end_date is None:
             end_idx = len(sorted_dates) - 1
         else:
-            end_idx = next((i for i, d in enumerate(sorted_dates) if d >= end_date), len(sorted_dates) - 1)
+            end_idx = min(int(sorted_dates.searchsorted(pd.Timestamp(end_date))), len(sorted_dates) - 1)
         
-        test_dates = sorted_dates[start_idx:end_idx + 1]
+        test_index = sorted_dates[start_idx:end_idx + 1]
+        test_dates = np.datetime_as_string(test_index.values, unit='D').tolist()
+        test_ns = test_index.asi8
         
         if len(test_dates) < 10:
             return {'error': 'Not enough data for backtest'}
         
         print(f"Running backtest from {test_dates[0]} to {test_dates[-1]} ({len(test_dates)} days)...")
         
-        # Initialize tracking
-        portfolio_value = self.initial_capital
-        market_value = self.initial_capital
-        
-        daily_results = []
-        equity_curve = [self.initial_capital]
-        market_curve = [self.initial_capital]
+        n_days = len(test_dates) - 1
         
         current_picks = []
+        pick_cols = None
+        pick_day_returns = np.empty(0)
+        pick_start = 0  # test day that pick_day_returns[0] belongs to
+        portfolio_day_returns = np.full(n_days, np.nan)
+        pick_counts = np.zeros(n_days, dtype=np.int32)
+        
+        # Dense [test date, symbol] close panel, so the daily loop gathers
+        # columns of one contiguous array instead of touching each frame.
+        # float32 halves the memory moved per gather; percent returns don't
+        # need more precision.
+        symbol_to_col = {symbol: col for col, symbol in enumerate(stock_data)}
+        close_panel = np.full((len(test_index), len(symbol_to_col)), np.nan, dtype=np.float32)
+        sorted_frames = {}
+        symbol_dates = {}  # int64 ns timestamps per symbol
+        for symbol, df in stock_data.items():
+            close_panel[:, symbol_to_col[symbol]] = _aligned_closes(df, test_index, np.float32)
+            
+            # Sorted copy so the screening history is always a prefix slice
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
+            sorted_frames[symbol] = df
+            symbol_dates[symbol] = _calendar_dates(df.index).asi8
         
-        # Get initial market price
-        market_start_price = None
+        # Market daily returns over the test window
         if len(market_data) > 0:
-            market_start_price = market_data['close'].iloc[start_idx] if start_idx < len(market_data) else market_data['close'].iloc[0]
+            market_day_returns = _equal_weight_returns(_aligned_closes(market_data, test_index)[:, None])
+        else:
+            market_day_returns = np.full(n_days, np.nan)
+        
+        # Rows already known to be on or before the last screening date
+        screening_row_counts = dict.fromkeys(sorted_frames, 0)
+        
+        # Screening only needs the screener's lookback window of history
+        lookback = getattr(screener, 'required_lookback', None)
+        
+        # Screener results per rebalance date; only kept on the Backtester
+        # after the run when reuse_scans asks for them
+        if reuse_scans:
+            cache_key = _scan_cache_key(stock_data, market_data, screener)
+            if cache_key != self._scan_cache_key:
+                self._scan_cache = {}
+                self._scan_cache_key = cache_key
+            scan_cache = self._scan_cache
+        else:
+            scan_cache = {}
         
-        rebalance_counter = 0
+        # One worker pool for the whole run, reused on every rebalance
+        # (shut down even if a scan raises, so no worker processes outlive the run)
+        executor = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
         
-        for i, date in enumerate(test_dates[:-1]):  # Skip last day (no next day return)
-            next_date = test_dates[i + 1]
+        try:
+            rebalance_counter = 0
             
-            # Rebalance portfolio
-            if rebalance_counter == 0:
-                # Get data up to current date for screening
-                screening_data = {}
-                for symbol, df in stock_data.items():
-                    mask = df.index.strftime('%Y-%m-%d') <= date
-                    if mask.sum() >= 20:  # Need at least 20 days of history
-                        screening_data[symbol] = df[mask]
-                
-                if len(screening_data) >= 10:
-                    # Run screener
-                    results = screener.scan_universe(screening_data, market_data)
-                    
-                    # Get top picks
-                    top_picks = [r for r in results if r.get('composite_score', 0) > 0][:self.num_picks]
+            # Pick stocks day by day; compounding happens afterwards in one pass
+            for i, date in enumerate(test_dates[:-1]):  # Skip last day (no next day return)
+                # Rebalance portfolio
+                if rebalance_counter == 0:
+                    # Get data up to current date for screening
+                    screening_data = {}
+                    cutoff = test_ns[i]
+                    for symbol, df in sorted_frames.items():
+                        k = screening_row_counts[symbol]
+                        k += np.searchsorted(symbol_dates[symbol][k:], cutoff, side='right')
+                        screening_row_counts[symbol] = k
+                        if k >= 20:  # Need at least 20 days of history
+                            screening_data[symbol] = df.iloc[max(0, k - lookback):k] if lookback else df.iloc[:k]
                     
-                    if top_picks:
-                        current_picks = top_picks
-            
-            rebalance_counter = (rebalance_counter + 1) % rebalance_days
-            
-            # Calculate daily return for picks
-            if current_picks:
-                daily_returns = []
-                
-                for pick in current_picks:
-                    symbol = pick['symbol']
-                    if symbol in stock_data:
-                        df = stock_data[symbol]
+                    if len(screening_data) >= 10:
+                        # Run screener
+                        if date not in scan_cache:
+                            if executor is not None:
+                                scan_cache[date] = _parallel_scan(
+                                    executor, n_jobs, screener, screening_data, market_data
+                                )
+                            else:
+                                scan_cache[date] = screener.scan_universe(screening_data, market_data)
+                        results = scan_cache[date]
                         
-                        # Get prices for current and next date
-                        curr_mask = df.index.strftime('%Y-%m-%d') == date
-                        next_mask = df.index.strftime('%Y-%m-%d') == next_date
+                        # Get top picks
+                        top_picks = [r for r in results if r.get('composite_score', 0) > 0][:self.num_picks]
                         
-                        if curr_mask.sum() > 0 and next_mask.sum() > 0:
-                            curr_price = df.loc[curr_mask, 'close'].iloc[0]
-                            next_price = df.loc[next_mask, 'close'].iloc[0]
+                        if top_picks:
+                            current_picks = top_picks
                             
-                            if curr_price > 0:
-                                ret = (next_price / curr_price - 1) * 100
-                                daily_returns.append(ret)
+                            # Returns of the new picks are computed from today on
+                            pick_cols = [symbol_to_col[pick['symbol']] for pick in current_picks]
+                            pick_day_returns = np.empty(0)
                 
-                if daily_returns:
-                    avg_return = np.mean(daily_returns)
-                    portfolio_value *= (1 + avg_return / 100)
-            
-            # Calculate market return
-            if len(market_data) > 0:
-                curr_mask = market_data.index.strftime('%Y-%m-%d') == date
-                next_mask = market_data.index.strftime('%Y-%m-%d') == next_date
+                rebalance_counter = (rebalance_counter + 1) % rebalance_days
                 
-                if curr_mask.sum() > 0 and next_mask.sum() > 0:
-                    curr_market = market_data.loc[curr_mask, 'close'].iloc[0]
-                    next_market = market_data.loc[next_mask, 'close'].iloc[0]
-                    
-                    if curr_market > 0:
-                        market_ret = (next_market / curr_market - 1) * 100
-                        market_value *= (1 + market_ret / 100)
-            
-            # Record daily result
-            daily_results.append({
+                # Daily return for picks (NaN leaves the portfolio unchanged)
+                if current_picks:
+                    # Daily returns of the picks up to the next rebalance, so
+                    # only the days they are held for get computed; picks kept
+                    # past a rebalance get the next stretch
+                    if i - pick_start >= len(pick_day_returns):
+                        pick_start = i
+                        pick_day_returns = _equal_weight_returns(close_panel[i:i + rebalance_days + 1, pick_cols])
+                    portfolio_day_returns[i] = pick_day_returns[i - pick_start]
+                pick_counts[i] = len(current_picks)
+                
+                # Progress, with the equity compounded so far
+                if (i + 1) % 20 == 0:
+                    equity, market = _compound_equity(
+                        float(self.initial_capital), portfolio_day_returns[:i + 1], market_day_returns[:i + 1]
+                    )
+                    print(f"  Day {i + 1}/{n_days}: Portfolio ₹{equity[-1]/100000:.2f}L, Market ₹{market[-1]/100000:.2f}L")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        equity, market = _compound_equity(
+            float(self.initial_capital), portfolio_day_returns, market_day_returns
+        )
+        portfolio_value = equity[-1]
+        market_value = market[-1]
+        
+        # Round for output once, on whole arrays
+        portfolio_values = np.round(equity[1:], 2).tolist()
+        market_values = np.round(market[1:], 2).tolist()
+        portfolio_returns = np.round((equity[1:] / self.initial_capital - 1) * 100, 2).tolist()
+        market_returns = np.round((market[1:] / self.initial_capital - 1) * 100, 2).tolist()
+        
+        equity_curve = [self.initial_capital] + portfolio_values
+        market_curve = [self.initial_capital] + market_values
+        
+        # Per-day columns are kept as arrays above; records are only built
+        # here for the saved results format
+        daily_results = [
+            {
                 'date': next_date,
-                'portfolio_value': round(portfolio_value, 2),
-                'market_value': round(market_value, 2),
-                'portfolio_return': round((portfolio_value / self.initial_capital - 1) * 100, 2),
-                'market_return': round((market_value / self.initial_capital - 1) * 100, 2),
-                'num_picks': len(current_picks)
-            })
-            
-            equity_curve.append(round(portfolio_value, 2))
-            market_curve.append(round(market_value, 2))
-            
-            # Progress
-            if (i + 1) % 20 == 0:
-                print(f"  Day {i + 1}/{len(test_dates) - 1}: Portfolio ₹{portfolio_value/100000:.2f}L, Market ₹{market_value/100000:.2f}L")
+                'portfolio_value': pv,
+                'market_value': mv,
+                'portfolio_return': pr,
+                'market_return': mr,
+                'num_picks': n
+            }
+            for next_date, pv, mv, pr, mr, n in zip(
+                test_dates[1:], portfolio_values, market_values,
+                portfolio_returns, market_returns, pick_counts.tolist()
+            )
+        ]
         
         # Calculate summary statistics
         total_return = (portfolio_value / self.initial_capital - 1) * 100
@@ -177,27 +373,19 @@ class Backtester:
         alpha = total_return - market_return
         
         # Calculate daily returns for Sharpe ratio
-        daily_rets = []
-        for i in range(1, len(equity_curve)):
-            daily_rets.append((equity_curve[i] / equity_curve[i-1] - 1) * 100)
+        curve = np.asarray(equity_curve, dtype=np.float64)
+        daily_rets = np.diff(curve) / curve[:-1] * 100
+        has_rets = len(daily_rets) > 0
         
-        avg_daily_return = np.mean(daily_rets) if daily_rets else 0
-        std_daily_return = np.std(daily_rets) if daily_rets else 1
+        avg_daily_return = daily_rets.mean() if has_rets else 0
+        std_daily_return = daily_rets.std() if has_rets else 1
         sharpe_ratio = (avg_daily_return * 252) / (std_daily_return * np.sqrt(252)) if std_daily_return > 0 else 0
         
         # Win rate
-        winning_days = sum(1 for r in daily_rets if r > 0)
-        win_rate = (winning_days / len(daily_rets) * 100) if daily_rets else 0
+        win_rate = (daily_rets > 0).mean() * 100 if has_rets else 0
         
         # Max drawdown
-        peak = equity_curve[0]
-        max_drawdown = 0
-        for val in equity_curve:
-            if val > peak:
-                peak = val
-            drawdown = (peak - val) / peak * 100
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
+        max_drawdown = _max_drawdown_pct(curve)
         
         # Annualized return
         days = len(test_dates) - 1
@@ -218,8 +406,8 @@ class Backtester:
                 'win_rate_pct': round(win_rate, 1),
                 'max_drawdown_pct': round(max_drawdown, 2),
                 'avg_daily_return_pct': round(avg_daily_return, 3),
-                'best_day_pct': round(max(daily_rets), 2) if daily_rets else 0,
-                'worst_day_pct': round(min(daily_rets), 2) if daily_rets else 0,
+                'best_day_pct': round(daily_rets.max(), 2) if has_rets else 0,
+                'worst_day_pct': round(daily_rets.min(), 2) if has_rets else 0,
             },
             'equity_curve': equity_curve,
             'market_curve': market_curve,
@@ -265,15 +453,15 @@ class Backtester:
     def save_results(self, filepath: str):
         """Save backtest results to JSON"""
         if self.results:
-            with open(filepath, 'w') as f:
-                json.dump(self.results, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
             print(f"Backtest results saved to: {filepath}")
     
     def load_results(self, filepath: str) -> dict:
         """Load backtest results from JSON"""
         if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
-                self.results = json.load(f)
+            with open(filepath, 'rb') as f:
+                self.results = orjson.loads(f.read())
             return self.results
         return None
 
@@ -283,65 +471,45 @@ def run_quick_backtest(stock_data: dict, market_data, screener, days: int = 60)
     Quick backtest for demo purposes with synthetic data.
     Generates realistic backtest results.
     """
-    import random
-    
     print(f"Running quick backtest simulation ({days} days)...")
     
     initial_capital = 1000000
-    portfolio_value = initial_capital
-    market_value = initial_capital
     
-    equity_curve = [initial_capital]
-    market_curve = [initial_capital]
-    dates = ['Start']
+    base_date = datetime.now() - timedelta(days=days)
     
-    daily_rets = []
-    market_rets = []
+    # Weekdays only
+    business_days = pd.bdate_range(start=base_date, end=base_date + timedelta(days=days - 1))
+    dates = ['Start'] + business_days.strftime('%Y-%m-%d').tolist()
     
-    base_date = datetime.now() - timedelta(days=days)
+    # Generate realistic daily returns for the whole window at once
+    # Strategy has slight edge (0.03% daily alpha on average)
+    rng = np.random.default_rng()
+    market_rets = rng.normal(0.04, 0.95, size=len(business_days))  # Market: ~10% annual, 15% vol
+    strategy_edge = rng.normal(0.03, 0.25, size=len(business_days))  # Small consistent edge
+    daily_rets = market_rets + strategy_edge
+    
+    portfolio_path = initial_capital * np.cumprod(1 + daily_rets / 100)
+    market_path = initial_capital * np.cumprod(1 + market_rets / 100)
+    
+    portfolio_value = portfolio_path[-1] if len(portfolio_path) else initial_capital
+    market_value = market_path[-1] if len(market_path) else initial_capital
     
-    for i in range(days):
-        # Skip weekends
-        current_date = base_date + timedelta(days=i)
-        if current_date.weekday() >= 5:
-            continue
-        
-        # Generate realistic daily returns
-        # Strategy has slight edge (0.03% daily alpha on average)
-        market_ret = random.gauss(0.04, 0.95)  # Market: ~10% annual, 15% vol
-        strategy_edge = random.gauss(0.03, 0.25)  # Small consistent edge
-        portfolio_ret = market_ret + strategy_edge
-        
-        portfolio_value *= (1 + portfolio_ret / 100)
-        market_value *= (1 + market_ret / 100)
-        
-        equity_curve.append(round(portfolio_value, 2))
-        market_curve.append(round(market_value, 2))
-        dates.append(current_date.strftime('%Y-%m-%d'))
-        
-        daily_rets.append(portfolio_ret)
-        market_rets.append(market_ret)
+    equity_curve = [initial_capital] + np.round(portfolio_path, 2).tolist()
+    market_curve = [initial_capital] + np.round(market_path, 2).tolist()
     
     # Calculate statistics
     total_return = (portfolio_value / initial_capital - 1) * 100
     market_return = (market_value / initial_capital - 1) * 100
     alpha = total_return - market_return
     
-    avg_daily = np.mean(daily_rets)
-    std_daily = np.std(daily_rets)
+    avg_daily = daily_rets.mean()
+    std_daily = daily_rets.std()
     sharpe = (avg_daily * 252) / (std_daily * np.sqrt(252)) if std_daily > 0 else 0
     
-    win_rate = sum(1 for r in daily_rets if r > 0) / len(daily_rets) * 100
+    win_rate = (daily_rets > 0).mean() * 100
     
     # Max drawdown
-    peak = equity_curve[0]
-    max_dd = 0
-    for val in equity_curve:
-        if val > peak:
-            peak = val
-        dd = (peak - val) / peak * 100
-        if dd > max_dd:
-            max_dd = dd
+    max_dd = _max_drawdown_pct(equity_curve)
     
     trading_days = len(daily_rets)
     annualized = ((portfolio_value / initial_capital) ** (252 / trading_days) - 1) * 100 if trading_days > 0 else 0
@@ -361,8 +529,8 @@ def run_quick_backtest(stock_data: dict, market_data, screener, days: int = 60)
             'win_rate_pct': round(win_rate, 1),
             'max_drawdown_pct': round(max_dd, 2),
             'avg_daily_return_pct': round(avg_daily, 3),
-            'best_day_pct': round(max(daily_rets), 2),
-            'worst_day_pct': round(min(daily_rets), 2),
+            'best_day_pct': round(daily_rets.max(), 2),
+            'worst_day_pct': round(daily_rets.min(), 2),
         },
         'equity_curve': equity_curve,
         'market_curve': market_curve,
@@ -12,6 +12,16 @@ from datetime import datetime, timedelta
 import os
 import json
 import time
+import asyncio
+import importlib.util
+import threading
+from collections import deque
+from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class DataFetcher:
@@ -20,10 +30,52 @@ class DataFetcher:
     Supports multiple data sources with fallback options.
     """
     
-    def __init__(self, cache_dir: str = "./data_cache"):
+    # nsepy column names (lower-cased) -> standard names
+    _NSE_COL_MAP = {
+        'prev close': 'prev_close',
+        'deliverable volume': 'deliverable_volume',
+        '%deliverble': 'delivery_pct'
+    }
+    
+    # jugaad-data column names (snake-cased) -> standard names
+    _JUGAAD_COL_MAP = {
+        'ltp': 'close'
+    }
+    
+    # Module each data source needs, and its pip package
+    _SOURCE_MODULES = {
+        'yfinance': ('yfinance', 'yfinance'),
+        'yfinance_async': ('aiohttp', 'aiohttp'),
+        'nsepy': ('nsepy', 'nsepy'),
+        'jugaad': ('jugaad_data', 'jugaad-data'),
+    }
+    
+    def __init__(self, cache_dir: str = "./data_cache", max_requests_per_sec: int = 10):
         self.cache_dir = cache_dir
         os.makedirs(cache_dir, exist_ok=True)
         
+        # Start times of the most recent requests, shared by all fetch threads
+        self._request_times = deque(maxlen=max(1, int(max_requests_per_sec)))
+        self._rate_lock = threading.Lock()
+        
+        # One keep-alive session for every yfinance request, so TCP/TLS setup
+        # is paid once per connection instead of once per symbol
+        self._session = requests.Session()
+        self._session.headers.update({'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64)'})
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # Which optional backends are installed, checked once without importing them
+        self.available_sources = {
+            source: importlib.util.find_spec(module) is not None
+            for source, (module, _) in self._SOURCE_MODULES.items()
+        }
+        self.available_sources['csv'] = True
+        
         # NSE Nifty 50 symbols (add .NS for Yahoo Finance)
         self.nifty50 = [
             "RELIANCE", "TCS", "HDFCBANK", "INFY", "ICICIBANK",
@@ -63,6 +115,28 @@ class DataFetcher:
             "BLUEDART", "CONCOR", "FEDERALBNK", "IDFCFIRSTB", "RBLBANK"
         ]
     
+    # Optional backends, imported on first use (ImportError if not installed)
+    
+    @cached_property
+    def _yf(self):
+        import yfinance
+        return yfinance
+    
+    @cached_property
+    def _aiohttp(self):
+        import aiohttp
+        return aiohttp
+    
+    @cached_property
+    def _nsepy_get_history(self):
+        from nsepy import get_history
+        return get_history
+    
+    @cached_property
+    def _jugaad_stock_df(self):
+        from jugaad_data.nse import stock_df
+        return stock_df
+    
     def get_universe(self, universe: str = "nifty200") -> list:
         """Get list of symbols for a given universe"""
         
@@ -75,13 +149,24 @@ class DataFetcher:
         else:
             return self.nifty50
     
+    def _throttle(self):
+        """Block until another request fits under max_requests_per_sec"""
+        with self._rate_lock:
+            now = time.monotonic()
+            if len(self._request_times) == self._request_times.maxlen:
+                wait = self._request_times[0] + 1.0 - now
+                if wait > 0:
+                    time.sleep(wait)
+                    now = time.monotonic()
+            self._request_times.append(now)
+    
     def fetch_yfinance(self, symbol: str, days: int = 365) -> pd.DataFrame:
         """
         Fetch data using yfinance (Yahoo Finance).
         Requires: pip install yfinance
         """
         try:
-            import yfinance as yf
+            yf = self._yf
             
             # Add .NS suffix for NSE stocks
             yf_symbol = f"{symbol}.NS"
@@ -89,17 +174,19 @@ class DataFetcher:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
             
-            ticker = yf.Ticker(yf_symbol)
+            self._throttle()
+            ticker = yf.Ticker(yf_symbol, session=self._session)
             df = ticker.history(start=start_date, end=end_date)
             
             if len(df) == 0:
                 # Try BSE suffix
                 yf_symbol = f"{symbol}.BO"
-                ticker = yf.Ticker(yf_symbol)
+                self._throttle()
+                ticker = yf.Ticker(yf_symbol, session=self._session)
                 df = ticker.history(start=start_date, end=end_date)
             
             # Standardize column names
-            df.columns = [c.lower() for c in df.columns]
+            df.rename(columns=str.lower, inplace=True)
             
             return df
         
@@ -110,39 +197,173 @@ class DataFetcher:
             print(f"Error fetching {symbol}: {e}")
             return pd.DataFrame()
     
+    def fetch_yfinance_batch(self, symbols: list, days: int = 365) -> dict:
+        """
+        Fetch several NSE symbols in one yfinance download.
+        Requires: pip install yfinance
+        
+        Args:
+            symbols: Stock symbols (without exchange suffix)
+            days: Number of days of history
+        
+        Returns:
+            Dict of {symbol: DataFrame}; symbols with no data are left out
+        """
+        try:
+            yf = self._yf
+            
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=days)
+            
+            yf_symbols = [f"{symbol}.NS" for symbol in symbols]
+            
+            self._throttle()
+            data = yf.download(" ".join(yf_symbols), start=start_date, end=end_date,
+                               group_by='ticker', auto_adjust=True, threads=True, progress=False,
+                               session=self._session)
+            
+            stock_data = {}
+            for symbol, yf_symbol in zip(symbols, yf_symbols):
+                if isinstance(data.columns, pd.MultiIndex):
+                    if yf_symbol not in data.columns.get_level_values(0):
+                        continue
+                    df = data[yf_symbol]
+                else:
+                    df = data
+                
+                # The download aligns all tickers on one index; drop the
+                # dates this symbol has no rows for
+                df = df.dropna(how='all')
+                if len(df) == 0:
+                    continue
+                
+                df.rename(columns=str.lower, inplace=True)
+                stock_data[symbol] = df
+            
+            return stock_data
+        
+        except ImportError:
+            print("yfinance not installed. Run: pip install yfinance")
+            return {}
+        except Exception as e:
+            print(f"Error fetching batch {symbols[0]}..{symbols[-1]}: {e}")
+            return {}
+    
+    async def _throttle_async(self):
+        """Event-loop version of _throttle: waits without blocking other fetches"""
+        while True:
+            now = time.monotonic()
+            if len(self._request_times) < self._request_times.maxlen:
+                break
+            wait = self._request_times[0] + 1.0 - now
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+        self._request_times.append(now)
+    
+    async def fetch_yfinance_async(self, session, symbol: str, days: int = 365) -> pd.DataFrame:
+        """
+        Fetch one NSE symbol straight from Yahoo's chart API.
+        Requires: pip install aiohttp
+        
+        Prices are split/dividend adjusted like Ticker.history().
+        
+        Args:
+            session: Open aiohttp.ClientSession
+            symbol: Stock symbol (without exchange suffix)
+            days: Number of days of history
+        
+        Returns:
+            DataFrame with OHLCV data (empty on failure)
+        """
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        params = {
+            'period1': int(start_date.timestamp()),
+            'period2': int(end_date.timestamp()),
+            'interval': '1d',
+            'events': 'div,splits',
+        }
+        url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}.NS"
+        
+        try:
+            await self._throttle_async()
+            async with session.get(url, params=params) as resp:
+                resp.raise_for_status()
+                data = await resp.json()
+            
+            result = data['chart']['result'][0]
+            quote = result['indicators']['quote'][0]
+            
+            index = pd.to_datetime(result['timestamp'], unit='s', utc=True)
+            index = index.tz_convert(result['meta'].get('exchangeTimezoneName', 'Asia/Kolkata')).normalize()
+            
+            df = pd.DataFrame({
+                'open': quote['open'],
+                'high': quote['high'],
+                'low': quote['low'],
+                'close': quote['close'],
+                'volume': quote['volume'],
+            }, index=index, dtype=np.float64).dropna(how='all')
+            
+            adjclose = result['indicators'].get('adjclose')
+            if adjclose:
+                adj = pd.Series(adjclose[0]['adjclose'], index=index, dtype=np.float64).reindex(df.index)
+                ratio = adj / df['close']
+                df[['open', 'high', 'low']] = df[['open', 'high', 'low']].mul(ratio, axis=0)
+                df['close'] = adj
+            
+            return df
+        
+        except Exception as e:
+            print(f"Error fetching {symbol}: {e}")
+            return pd.DataFrame()
+    
+    async def fetch_symbols_async(self, symbols: list, days: int = 365,
+                                  max_connections: int = 16,
+                                  days_by_symbol: Optional[dict] = None) -> dict:
+        """
+        Fetch many symbols concurrently on one event loop.
+        
+        All requests share one aiohttp session, so connections stay alive
+        across symbols. Total time is roughly the slowest fetch, not the sum.
+        days_by_symbol overrides days for the symbols it lists.
+        
+        Returns:
+            Dict of {symbol: DataFrame}; failed symbols are left out
+        """
+        try:
+            aiohttp = self._aiohttp
+        except ImportError:
+            print("aiohttp not installed. Run: pip install aiohttp")
+            return {}
+        
+        connector = aiohttp.TCPConnector(limit=max_connections)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            frames = await asyncio.gather(
+                *[self.fetch_yfinance_async(session, symbol, days_by_symbol.get(symbol, days)
+                                            if days_by_symbol else days)
+                  for symbol in symbols]
+            )
+        
+        return {symbol: df for symbol, df in zip(symbols, frames) if len(df) > 0}
+    
     def fetch_nsetools(self, symbol: str) -> pd.DataFrame:
         """
         Fetch data using nsetools/nsepy.
         Requires: pip install nsepy
         """
         try:
-            from nsepy import get_history
+            get_history = self._nsepy_get_history
             
             end_date = datetime.now().date()
             start_date = end_date - timedelta(days=365)
             
             df = get_history(symbol=symbol, start=start_date, end=end_date)
             
-            # Standardize column names
-            df.columns = [c.lower() for c in df.columns]
-            
-            # Rename columns to match our standard
-            column_mapping = {
-                'symbol': 'symbol',
-                'series': 'series',
-                'prev close': 'prev_close',
-                'open': 'open',
-                'high': 'high',
-                'low': 'low',
-                'close': 'close',
-                'vwap': 'vwap',
-                'volume': 'volume',
-                'turnover': 'turnover',
-                'trades': 'trades',
-                'deliverable volume': 'deliverable_volume',
-                '%deliverble': 'delivery_pct'
-            }
-            df = df.rename(columns=column_mapping)
+            # Standardize column names to match our standard
+            nse_map = self._NSE_COL_MAP
+            df.rename(columns=lambda c: nse_map.get(c.lower(), c.lower()), inplace=True)
             
             return df
         
@@ -159,19 +380,18 @@ class DataFetcher:
         Requires: pip install jugaad-data
         """
         try:
-            from jugaad_data.nse import stock_df
+            stock_df = self._jugaad_stock_df
             
             end_date = datetime.now().date()
             start_date = end_date - timedelta(days=days)
             
             df = stock_df(symbol=symbol, from_date=start_date, to_date=end_date)
             
-            # Standardize column names
-            df.columns = [c.lower().replace(' ', '_') for c in df.columns]
-            
-            # Ensure proper column names
-            if 'ltp' in df.columns:
-                df = df.rename(columns={'ltp': 'close'})
+            # Standardize column names, ensuring proper names (ltp -> close)
+            jugaad_map = self._JUGAAD_COL_MAP
+            df.rename(columns=lambda c: jugaad_map.get(c.lower().replace(' ', '_'),
+                                                       c.lower().replace(' ', '_')),
+                      inplace=True)
             
             return df
         
@@ -195,7 +415,7 @@ class DataFetcher:
         
         try:
             df = pd.read_csv(filepath, parse_dates=['date'], index_col='date')
-            df.columns = [c.lower() for c in df.columns]
+            df.rename(columns=str.lower, inplace=True)
             return df
         except Exception as e:
             print(f"Error loading CSV for {symbol}: {e}")
@@ -207,14 +427,21 @@ class DataFetcher:
         
         Args:
             symbol: Stock symbol (without exchange suffix)
-            source: Data source ('yfinance', 'nsepy', 'jugaad', 'csv')
+            source: Data source ('yfinance', 'yfinance_async', 'nsepy', 'jugaad', 'csv')
             days: Number of days of history
         
         Returns:
             DataFrame with OHLCV data
         """
         
-        if source == "yfinance":
+        # Single-symbol async requests go through plain yfinance
+        backend = "yfinance" if source == "yfinance_async" else source
+        if backend in self._SOURCE_MODULES and not self.available_sources[backend]:
+            module, package = self._SOURCE_MODULES[backend]
+            print(f"{module} not installed. Run: pip install {package}")
+            return pd.DataFrame()
+        
+        if source in ("yfinance", "yfinance_async"):
             return self.fetch_yfinance(symbol, days)
         elif source == "nsepy":
             return self.fetch_nsetools(symbol)
@@ -227,42 +454,140 @@ class DataFetcher:
             return pd.DataFrame()
     
     def fetch_universe(self, universe: str = "nifty50", source: str = "yfinance", 
-                       days: int = 365, delay: float = 0.5) -> dict:
+                       days: int = 365, max_workers: int = 8, batch_size: int = 20,
+                       max_age_hours: Optional[float] = 24, incremental: bool = False) -> dict:
         """
         Fetch data for entire universe of stocks.
         
+        Symbols with a fresh per-symbol cache file are loaded from disk; only
+        the missing or stale ones hit the network, and are cached afterwards.
+        
+        Per-symbol requests run concurrently on a thread pool; fetch_yfinance
+        keeps the overall request rate under max_requests_per_sec. For
+        yfinance, symbols are downloaded batch_size at a time, one batch after
+        another, and only the ones a batch misses are fetched individually
+        (which also retries them on BSE). For 'yfinance_async', all symbols
+        are fetched on one asyncio event loop instead, with the same
+        per-symbol fallback.
+        
+        With incremental, a symbol whose cache file is too old keeps its cached
+        bars and only fetches the days since the last one. Off by default, as
+        adjusted prices already cached are not re-adjusted for later splits
+        or dividends.
+        
         Args:
             universe: Stock universe ('nifty50', 'nifty100', 'nifty200')
             source: Data source
             days: Number of days of history
-            delay: Delay between requests to avoid rate limiting
+            max_workers: Number of concurrent fetch threads
+            batch_size: Symbols per yfinance download
+            max_age_hours: Max age of a usable cache file (None = skip the cache)
+            incremental: Extend stale cache files instead of refetching them
         
         Returns:
             Dict of {symbol: DataFrame}
         """
         
         symbols = self.get_universe(universe)
-        stock_data = {}
-        
-        print(f"Fetching {len(symbols)} stocks from {source}...")
-        
-        for i, symbol in enumerate(symbols):
-            print(f"  [{i+1}/{len(symbols)}] {symbol}...", end=" ")
-            
-            df = self.fetch_stock(symbol, source, days)
-            
-            if len(df) > 0:
-                stock_data[symbol] = df
-                print(f"OK ({len(df)} rows)")
+        fetched = {}
+        stale = {}
+        
+        if max_age_hours is not None:
+            for symbol in symbols:
+                df = self.get_cached(symbol, max_age_hours)
+                if df is not None:
+                    fetched[symbol] = df
+                elif incremental:
+                    df = self.get_cached(symbol, float('inf'))
+                    if df is not None and len(df) > 0:
+                        stale[symbol] = df
+        
+        to_fetch = [symbol for symbol in symbols if symbol not in fetched]
+        
+        # Stale symbols only need the days since their last cached bar
+        fetch_days = dict.fromkeys(to_fetch, days)
+        if stale:
+            tail_days = 1 + max((pd.Timestamp.now(tz=df.index.tz) - df.index[-1]).days
+                                for df in stale.values())
+            fetch_days.update(dict.fromkeys(stale, min(days, tail_days)))
+        
+        print(f"Fetching {len(to_fetch)} stocks from {source} "
+              f"({len(fetched)}/{len(symbols)} loaded from cache"
+              + (f", {len(stale)} extending it" if stale else "") + ")...")
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if source == "yfinance":
+                # Full histories and cache tails are batched apart, since
+                # each download covers one date range
+                batches = []
+                for group in ([symbol for symbol in to_fetch if symbol not in stale], list(stale)):
+                    batches += [group[i:i + batch_size] for i in range(0, len(group), batch_size)]
+                
+                # One batch at a time: yf.download keeps its results in a
+                # module-global dict, so concurrent downloads clobber each
+                # other. threads=True already spreads each batch's tickers
+                # over threads
+                for i, batch in enumerate(batches):
+                    batch_data = self.fetch_yfinance_batch(batch, fetch_days[batch[0]])
+                    fetched.update(batch_data)
+                    print(f"  Batch [{i+1}/{len(batches)}] {batch[0]}..{batch[-1]}: "
+                          f"{len(batch_data)}/{len(batch)} OK")
+                
+                # A stale symbol missing from its tail batch usually just has
+                # no new bars yet; its cached ones stand
+                remaining = [symbol for symbol in to_fetch if symbol not in fetched and symbol not in stale]
+            elif source == "yfinance_async":
+                async_data = asyncio.run(self.fetch_symbols_async(to_fetch, days, days_by_symbol=fetch_days))
+                fetched.update(async_data)
+                print(f"  Async fetch: {len(async_data)}/{len(to_fetch)} OK")
+                
+                remaining = [symbol for symbol in to_fetch if symbol not in fetched]
             else:
-                print("FAILED")
+                remaining = to_fetch
+            
+            futures = {executor.submit(self.fetch_stock, symbol, source, fetch_days[symbol]): symbol
+                       for symbol in remaining}
             
-            if delay > 0:
-                time.sleep(delay)
+            for i, future in enumerate(as_completed(futures)):
+                symbol = futures[future]
+                df = future.result()
+                
+                if len(df) > 0:
+                    fetched[symbol] = df
+                    print(f"  [{i+1}/{len(remaining)}] {symbol}... OK ({len(df)} rows)")
+                else:
+                    print(f"  [{i+1}/{len(remaining)}] {symbol}... FAILED")
+        
+        for symbol, cached in stale.items():
+            fetched[symbol] = self._append_bars(cached, fetched.get(symbol), days)
+        
+        if max_age_hours is not None:
+            fresh = {symbol: fetched[symbol] for symbol in to_fetch if symbol in fetched}
+            if fresh:
+                self.cache_data(fresh)
+        
+        # Keep universe order regardless of completion order
+        stock_data = {symbol: fetched[symbol] for symbol in symbols if symbol in fetched}
         
         print(f"\nFetched {len(stock_data)}/{len(symbols)} stocks successfully")
         return stock_data
     
+    @staticmethod
+    def _append_bars(cached: pd.DataFrame, new: Optional[pd.DataFrame], days: int) -> pd.DataFrame:
+        """Cached bars extended by newly fetched ones (which win on overlap), trimmed to `days`"""
+        if new is None or len(new) == 0:
+            return cached
+        
+        # A batch download's index is tz-naive, a per-symbol fetch's is not
+        if new.index.tz is not None and cached.index.tz is None:
+            new = new.tz_localize(None)
+        elif new.index.tz is None and cached.index.tz is not None:
+            new = new.tz_localize(cached.index.tz)
+        
+        df = pd.concat([cached, new])
+        df = df[~df.index.duplicated(keep='last')].sort_index()
+        return df[df.index > df.index[-1] - pd.Timedelta(days=days)]
+    
     def fetch_index(self, index: str = "NIFTY50", source: str = "yfinance", 
                     days: int = 365) -> pd.DataFrame:
         """Fetch index data for benchmark comparison"""
@@ -276,16 +601,17 @@ class DataFetcher:
         
         if source == "yfinance":
             try:
-                import yfinance as yf
+                yf = self._yf
                 
                 yf_symbol = index_symbols.get(index, "^NSEI")
                 
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=days)
                 
-                ticker = yf.Ticker(yf_symbol)
+                self._throttle()
+                ticker = yf.Ticker(yf_symbol, session=self._session)
                 df = ticker.history(start=start_date, end=end_date)
-                df.columns = [c.lower() for c in df.columns]
+                df.rename(columns=str.lower, inplace=True)
                 
                 return df
             
@@ -295,128 +621,178 @@ class DataFetcher:
         
         return pd.DataFrame()
     
-    def cache_data(self, stock_data: dict, filename: str = "stock_cache.pkl"):
-        """Cache fetched data to disk"""
-        import pickle
-        
-        filepath = os.path.join(self.cache_dir, filename)
+    def cache_data(self, stock_data: dict):
+        """
+        Cache fetched data to disk, one Parquet file per symbol.
         
-        # Convert DataFrames to dict format for JSON serialization
-        cache_data = {
-            'timestamp': datetime.now().isoformat(),
-            'data': {sym: df.to_dict() for sym, df in stock_data.items()}
-        }
+        A metadata.parquet sidecar lists every cached symbol and when it
+        was last written; symbols not in stock_data keep their entries.
+        """
+        cached_at = []
+        for sym, df in stock_data.items():
+            df.to_parquet(os.path.join(self.cache_dir, f"{sym}.parquet"), compression='snappy')
+            cached_at.append(datetime.now())
         
-        with open(filepath, 'wb') as f:
-            pickle.dump(cache_data, f)
+        metadata_path = os.path.join(self.cache_dir, "metadata.parquet")
+        metadata = pd.DataFrame({'symbol': list(stock_data), 'cached_at': cached_at})
         
-        print(f"Data cached to {filepath}")
-    
-    def load_cache(self, filename: str = "stock_cache.pkl", max_age_hours: int = 24) -> dict:
-        """Load cached data if fresh enough"""
-        import pickle
+        if os.path.exists(metadata_path):
+            previous = pd.read_parquet(metadata_path)
+            previous = previous[~previous['symbol'].isin(metadata['symbol'])]
+            metadata = pd.concat([previous, metadata], ignore_index=True)
         
-        filepath = os.path.join(self.cache_dir, filename)
+        metadata.to_parquet(metadata_path)
         
-        if not os.path.exists(filepath):
-            return {}
+        print(f"Data cached to {self.cache_dir} ({len(stock_data)} symbols)")
+    
+    def get_cached(self, symbol: str, max_age_hours: float = 24) -> Optional[pd.DataFrame]:
+        """Load one symbol from the cache, or None if missing or too old"""
+        filepath = os.path.join(self.cache_dir, f"{symbol}.parquet")
         
         try:
-            with open(filepath, 'rb') as f:
-                cache_data = pickle.load(f)
-            
-            # Check age
-            cache_time = datetime.fromisoformat(cache_data['timestamp'])
-            age_hours = (datetime.now() - cache_time).total_seconds() / 3600
-            
+            age_hours = (time.time() - os.path.getmtime(filepath)) / 3600
             if age_hours > max_age_hours:
-                print(f"Cache too old ({age_hours:.1f} hours)")
-                return {}
-            
-            # Convert back to DataFrames
-            stock_data = {}
-            for sym, data in cache_data['data'].items():
-                df = pd.DataFrame(data)
-                df.index = pd.to_datetime(df.index)
-                stock_data[sym] = df
+                return None
             
-            print(f"Loaded {len(stock_data)} stocks from cache ({age_hours:.1f} hours old)")
-            return stock_data
+            # Parquet keeps the DatetimeIndex, so frames load as written
+            return pd.read_parquet(filepath)
         
+        except OSError:
+            return None
+        except Exception as e:
+            print(f"Error loading cache for {symbol}: {e}")
+            return None
+    
+    def load_cache(self, max_age_hours: int = 24) -> dict:
+        """Load every cached symbol that is fresh enough"""
+        metadata_path = os.path.join(self.cache_dir, "metadata.parquet")
+        
+        if not os.path.exists(metadata_path):
+            return {}
+        
+        try:
+            metadata = pd.read_parquet(metadata_path)
         except Exception as e:
             print(f"Error loading cache: {e}")
             return {}
+        
+        stock_data = {}
+        for sym in metadata['symbol']:
+            df = self.get_cached(sym, max_age_hours)
+            if df is not None:
+                stock_data[sym] = df
+        
+        stale = len(metadata) - len(stock_data)
+        print(f"Loaded {len(stock_data)} stocks from cache"
+              + (f" ({stale} missing or older than {max_age_hours} hours)" if stale else ""))
+        return stock_data
 
 
 def validate_data(df: pd.DataFrame) -> bool:
     """Validate that DataFrame has required columns and data"""
     
-    required_columns = ['open', 'high', 'low', 'close', 'volume']
+    required_columns = {'open', 'high', 'low', 'close', 'volume'}
     
-    for col in required_columns:
-        if col not in df.columns:
-            return False
+    if not required_columns.issubset(df.columns):
+        return False
     
     if len(df) < 60:  # Need at least 60 days
         return False
     
-    if df['close'].isna().sum() > len(df) * 0.1:  # More than 10% missing
+    closes = df['close'].to_numpy(dtype=np.float64)
+    if np.count_nonzero(np.isnan(closes)) > len(df) * 0.1:  # More than 10% missing
         return False
     
     return True
 
 
-def generate_sample_data(symbols: list, days: int = 365) -> dict:
+def _generate_slab(symbols: list, dates: pd.DatetimeIndex, seed) -> dict:
+    """Generate OHLCV frames for one slab of symbols as [n_symbols, days] arrays"""
+    rng = np.random.default_rng(seed)
+    n = len(symbols)
+    days = len(dates)
+    
+    # Random starting price between 100 and 5000
+    start_prices = rng.uniform(100, 5000, n)
+    
+    # Generate returns with slight trend and volatility
+    trends = rng.uniform(-0.0002, 0.0003, n)[:, None]
+    vols = rng.uniform(0.015, 0.03, n)[:, None]
+    
+    returns = rng.standard_normal((n, days)) * vols + trends
+    
+    # Add some patterns
+    # Momentum clusters: every `step` days a run of 5-14 days drifts one way
+    steps = rng.integers(20, 50, n)[:, None]
+    max_clusters = -(-days // 20)
+    cluster_sizes = rng.integers(5, 15, (n, max_clusters))
+    directions = rng.choice([-1, 1], (n, max_clusters))
+    
+    day = np.arange(days)[None, :]
+    cluster = day // steps
+    in_cluster = day % steps < np.take_along_axis(cluster_sizes, cluster, axis=1)
+    returns += in_cluster * np.take_along_axis(directions, cluster, axis=1) * 0.005
+    
+    prices = start_prices[:, None] * np.cumprod(1 + returns, axis=1)
+    
+    # Generate OHLC
+    open_prices = prices * (1 + rng.uniform(-0.01, 0.01, (n, days)))
+    high_prices = np.maximum(prices, open_prices) * (1 + rng.uniform(0, 0.02, (n, days)))
+    low_prices = np.minimum(prices, open_prices) * (1 - rng.uniform(0, 0.02, (n, days)))
+    
+    # Generate volume
+    base_volume = rng.uniform(100000, 10000000, n)[:, None]
+    volume = (base_volume * (1 + rng.uniform(-0.5, 1.5, (n, days)))).astype(int)
+    
+    stock_data = {}
+    for i, symbol in enumerate(symbols):
+        stock_data[symbol] = pd.DataFrame({
+            'open': open_prices[i],
+            'high': high_prices[i],
+            'low': low_prices[i],
+            'close': prices[i],
+            'volume': volume[i]
+        }, index=dates)
+    
+    return stock_data
+
+
+def generate_sample_data(symbols: list, days: int = 365, seed: Optional[int] = None,
+                         n_jobs: int = 1) -> dict:
     """
     Generate synthetic sample data for testing.
     Useful when you can't fetch real data.
+    
+    Symbols are generated together as [n_symbols, days] arrays; with
+    n_jobs > 1 the universe is split into slabs generated in worker
+    processes, each from its own child seed.
+    
+    Args:
+        symbols: Stock symbols to generate
+        days: Number of days of history
+        seed: Seed for reproducible data (default: random); the same seed
+            gives the same data only for the same n_jobs
+        n_jobs: Worker processes (1 = generate in this process)
+    
+    Returns:
+        Dict of {symbol: DataFrame with OHLCV}
     """
     
     print("Generating sample data for testing...")
     
-    stock_data = {}
     dates = pd.date_range(end=datetime.now(), periods=days, freq='D')
     
-    for symbol in symbols:
-        np.random.seed(hash(symbol) % (2**32))
-        
-        # Random starting price between 100 and 5000
-        start_price = np.random.uniform(100, 5000)
+    if n_jobs > 1 and len(symbols) > 1:
+        slab_size = -(-len(symbols) // n_jobs)
+        slabs = [symbols[i:i + slab_size] for i in range(0, len(symbols), slab_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(slabs))
         
-        # Generate returns with slight trend and volatility
-        trend = np.random.uniform(-0.0002, 0.0003)
-        volatility = np.random.uniform(0.015, 0.03)
-        
-        returns = np.random.normal(trend, volatility, days)
-        
-        # Add some patterns
-        # Momentum clusters
-        for i in range(0, days, np.random.randint(20, 50)):
-            cluster_size = np.random.randint(5, 15)
-            direction = np.random.choice([-1, 1])
-            returns[i:i+cluster_size] += direction * 0.005
-        
-        prices = start_price * np.cumprod(1 + returns)
-        
-        # Generate OHLC
-        open_prices = prices * (1 + np.random.uniform(-0.01, 0.01, days))
-        high_prices = np.maximum(prices, open_prices) * (1 + np.random.uniform(0, 0.02, days))
-        low_prices = np.minimum(prices, open_prices) * (1 - np.random.uniform(0, 0.02, days))
-        
-        # Generate volume
-        base_volume = np.random.uniform(100000, 10000000)
-        volume = base_volume * (1 + np.random.uniform(-0.5, 1.5, days))
-        volume = volume.astype(int)
-        
-        df = pd.DataFrame({
-            'open': open_prices,
-            'high': high_prices,
-            'low': low_prices,
-            'close': prices,
-            'volume': volume
-        }, index=dates)
-        
-        stock_data[symbol] = df
+        stock_data = {}
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            for part in executor.map(_generate_slab, slabs, [dates] * len(slabs), seeds):
+                stock_data.update(part)
+    else:
+        stock_data = _generate_slab(symbols, dates, seed)
     
     print(f"Generated data for {len(symbols)} stocks")
     return stock_data
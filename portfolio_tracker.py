@@ -9,8 +9,9 @@ Calculates daily returns, absolute P&L, and percentage returns.
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import json
 import os
+import math
+import orjson
 
 
 class PortfolioTracker:
@@ -21,8 +22,16 @@ class PortfolioTracker:
     def __init__(self, initial_capital: float = 1000000, portfolio_file: str = "./portfolio/holdings.json"):
         self.initial_capital = initial_capital  # ₹10 Lakh default
         self.portfolio_file = portfolio_file
+        self.portfolio_dir = os.path.dirname(portfolio_file)
+        # The current month's history is an append-only journal (one JSON
+        # entry per line); earlier months are rolled into history_YYYY-MM.parquet
+        self.history_file = os.path.join(self.portfolio_dir, "history.jsonl")
         self.holdings = {}
-        self.history = []
+        self.history_current_month = []
+        
+        # Holdings as parallel arrays (symbols, quantity, buy price, invested),
+        # rebuilt lazily whenever self.holdings is replaced
+        self._holding_arrays = None
         
         # Ensure portfolio directory exists
         os.makedirs(os.path.dirname(portfolio_file), exist_ok=True)
@@ -34,25 +43,100 @@ class PortfolioTracker:
         """Load existing portfolio from file"""
         if os.path.exists(self.portfolio_file):
             try:
-                with open(self.portfolio_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.portfolio_file, 'rb') as f:
+                    data = orjson.loads(f.read())
                     self.holdings = data.get('holdings', {})
-                    self.history = data.get('history', [])
+                    self._holding_arrays = None
                     self.initial_capital = data.get('initial_capital', self.initial_capital)
+                
+                if os.path.exists(self.history_file):
+                    with open(self.history_file, 'rb') as f:
+                        self.history_current_month = [orjson.loads(line) for line in f if line.strip()]
+                elif 'history' in data:
+                    # Older files kept history inline; move it to shards + journal
+                    self.history_current_month = []
+                    self._write_history()
+                    for entry in data['history']:
+                        self._append_history(entry)
+                
                 print(f"Loaded portfolio: {len(self.holdings)} holdings")
             except Exception as e:
                 print(f"Error loading portfolio: {e}")
     
     def save_portfolio(self):
-        """Save portfolio to file"""
+        """Save holdings to file (history is journaled separately)"""
         data = {
             'initial_capital': self.initial_capital,
             'holdings': self.holdings,
-            'history': self.history,
             'last_updated': datetime.now().isoformat()
         }
-        with open(self.portfolio_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Compact by default; set PORTFOLIO_PRETTY_JSON=1 for a hand-readable file
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if os.environ.get('PORTFOLIO_PRETTY_JSON'):
+            option |= orjson.OPT_INDENT_2
+        
+        with open(self.portfolio_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+    
+    def _write_history(self):
+        """Rewrite the journal from history_current_month"""
+        with open(self.history_file, 'wb') as f:
+            f.writelines(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+                         for entry in self.history_current_month)
+    
+    def _history_shards(self) -> list:
+        """Paths of the monthly history shards, oldest first"""
+        return sorted(
+            os.path.join(self.portfolio_dir, name) for name in os.listdir(self.portfolio_dir)
+            if name.startswith("history_") and name.endswith(".parquet")
+        )
+    
+    def _roll_history(self):
+        """Move the journaled month into its Parquet shard and start a new journal"""
+        month = self.history_current_month[0]['date'][:7]
+        shard = os.path.join(self.portfolio_dir, f"history_{month}.parquet")
+        
+        df = pd.DataFrame(self.history_current_month)
+        if os.path.exists(shard):
+            df = pd.concat([pd.read_parquet(shard), df], ignore_index=True)
+        df.to_parquet(shard, index=False)
+        
+        self.history_current_month = []
+        self._write_history()
+    
+    def _append_history(self, entry: dict):
+        """Add one history entry, appending a single line to the journal"""
+        if self.history_current_month and self.history_current_month[0]['date'][:7] != entry['date'][:7]:
+            self._roll_history()
+        
+        self.history_current_month.append(entry)
+        with open(self.history_file, 'ab') as f:
+            f.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY))
+    
+    def get_history(self, last_n: int = None) -> pd.DataFrame:
+        """
+        Portfolio history as a DataFrame, oldest first.
+        
+        Args:
+            last_n: Only return the latest n entries (None = all); older
+                monthly shards are only read when they are needed
+        
+        Returns:
+            DataFrame with date, portfolio_value, absolute_return,
+            percentage_return and holdings_count columns
+        """
+        parts = [pd.DataFrame(self.history_current_month)]
+        count = len(self.history_current_month)
+        
+        for shard in reversed(self._history_shards()):
+            if last_n is not None and count >= last_n:
+                break
+            df = pd.read_parquet(shard)
+            parts.insert(0, df)
+            count += len(df)
+        
+        history = pd.concat(parts, ignore_index=True)
+        return history.tail(last_n).reset_index(drop=True) if last_n is not None else history
     
     def create_portfolio(self, stocks: list, stock_prices: dict):
         """
@@ -66,11 +150,13 @@ class PortfolioTracker:
             print("No stocks to invest in!")
             return
         
-        # Equal allocation
-        allocation_per_stock = self.initial_capital / len(stocks)
+        # Equal allocation, in whole paise so share counts and amounts are exact
+        allocation_paise = round(self.initial_capital * 100) // len(stocks)
+        allocation_per_stock = allocation_paise / 100
         
         self.holdings = {}
-        total_invested = 0
+        self._holding_arrays = None
+        total_invested_paise = 0
         
         print(f"\n{'='*60}")
         print(f"CREATING PORTFOLIO - ₹{self.initial_capital:,.0f} Investment")
@@ -78,23 +164,31 @@ class PortfolioTracker:
         print(f"Allocating ₹{allocation_per_stock:,.2f} per stock across {len(stocks)} stocks\n")
         
         for symbol in stocks:
-            if symbol in stock_prices and stock_prices[symbol] > 0:
-                price = stock_prices[symbol]
-                quantity = int(allocation_per_stock / price)  # Full shares only
+            # A missing last bar comes through as NaN; such stocks are skipped
+            price = stock_prices.get(symbol, 0)
+            price_paise = round(price * 100) if math.isfinite(price) else 0
+            if price_paise > 0:
+                quantity = allocation_paise // price_paise  # Full shares only
                 
                 if quantity > 0:
-                    invested = quantity * price
+                    invested_paise = quantity * price_paise
+                    price = price_paise / 100
+                    invested = invested_paise / 100
                     self.holdings[symbol] = {
                         'quantity': quantity,
                         'buy_price': price,
+                        'buy_price_paise': price_paise,
                         'buy_date': datetime.now().strftime('%Y-%m-%d'),
-                        'invested_amount': invested
+                        'invested_amount': invested,
+                        'invested_paise': invested_paise
                     }
-                    total_invested += invested
+                    total_invested_paise += invested_paise
                     print(f"  {symbol:<15} | Qty: {quantity:>6} | Price: ₹{price:>10,.2f} | Invested: ₹{invested:>12,.2f}")
         
+        total_invested = total_invested_paise / 100
+        
         # Track initial state
-        self.history.append({
+        self._append_history({
             'date': datetime.now().strftime('%Y-%m-%d'),
             'portfolio_value': total_invested,
             'absolute_return': 0,
@@ -110,6 +204,21 @@ class PortfolioTracker:
         
         self.save_portfolio()
     
+    def _get_holding_arrays(self) -> tuple:
+        """Holdings as parallel (symbols, quantity, buy paise, invested paise) int64 arrays"""
+        if self._holding_arrays is None:
+            holdings = self.holdings.values()
+            # Holdings saved before paise amounts were stored are converted here
+            self._holding_arrays = (
+                list(self.holdings),
+                np.array([h['quantity'] for h in holdings], dtype=np.int64),
+                np.array([h.get('buy_price_paise', round(h['buy_price'] * 100)) for h in holdings],
+                         dtype=np.int64),
+                np.array([h.get('invested_paise', round(h['invested_amount'] * 100)) for h in holdings],
+                         dtype=np.int64),
+            )
+        return self._holding_arrays
+    
     def update_portfolio(self, current_prices: dict):
         """
         Update portfolio with current prices and calculate returns.
@@ -124,39 +233,57 @@ class PortfolioTracker:
             print("No holdings to update!")
             return None
         
-        total_current_value = 0
-        total_invested = 0
-        stock_returns = []
-        
-        for symbol, holding in self.holdings.items():
-            if symbol in current_prices:
-                current_price = current_prices[symbol]
-                current_value = holding['quantity'] * current_price
-                invested = holding['invested_amount']
-                
-                stock_return = (current_price - holding['buy_price']) / holding['buy_price'] * 100
-                stock_pnl = current_value - invested
-                
-                total_current_value += current_value
-                total_invested += invested
-                
-                stock_returns.append({
-                    'symbol': symbol,
-                    'quantity': holding['quantity'],
-                    'buy_price': holding['buy_price'],
-                    'current_price': current_price,
-                    'invested': invested,
-                    'current_value': current_value,
-                    'pnl': stock_pnl,
-                    'return_pct': stock_return
-                })
+        symbols, quantity, buy_paise, invested_paise = self._get_holding_arrays()
+        
+        # Only holdings with a current price are valued; a NaN price (a
+        # missing last bar) counts as no price
+        prices = np.array([current_prices.get(symbol, np.nan) for symbol in symbols], dtype=np.float64)
+        priced = np.isfinite(prices)
+        if not priced.all():
+            symbols = [symbol for symbol, p in zip(symbols, priced) if p]
+            quantity, buy_paise, invested_paise = quantity[priced], buy_paise[priced], invested_paise[priced]
+            prices = prices[priced]
+        
+        # Integer paise arithmetic; converted to rupees only for the output
+        current_paise = np.round(prices * 100).astype(np.int64)
+        current_value_paise = quantity * current_paise
+        pnl_paise = current_value_paise - invested_paise
+        return_pct = (current_paise - buy_paise) / buy_paise * 100
+        
+        buy_price = buy_paise / 100
+        current_price = current_paise / 100
+        invested = invested_paise / 100
+        current_value = current_value_paise / 100
+        pnl = pnl_paise / 100
+        
+        total_current_paise = int(current_value_paise.sum())
+        total_invested_paise = int(invested_paise.sum())
+        total_current_value = total_current_paise / 100
+        total_invested = total_invested_paise / 100
+        
+        stock_returns = [
+            {
+                'symbol': symbol,
+                'quantity': q,
+                'buy_price': bp,
+                'current_price': cp,
+                'invested': inv,
+                'current_value': cv,
+                'pnl': pl,
+                'return_pct': rp
+            }
+            for symbol, q, bp, cp, inv, cv, pl, rp in zip(
+                symbols, quantity.tolist(), buy_price.tolist(), current_price.tolist(),
+                invested.tolist(), current_value.tolist(), pnl.tolist(), return_pct.tolist()
+            )
+        ]
         
         # Calculate portfolio totals
-        absolute_return = total_current_value - total_invested
+        absolute_return = (total_current_paise - total_invested_paise) / 100
         percentage_return = (absolute_return / total_invested * 100) if total_invested > 0 else 0
         
-        # Add to history
-        self.history.append({
+        # Add to history (holdings are unchanged, so only the journal is written)
+        self._append_history({
             'date': datetime.now().strftime('%Y-%m-%d %H:%M'),
             'portfolio_value': total_current_value,
             'absolute_return': absolute_return,
@@ -164,8 +291,6 @@ class PortfolioTracker:
             'holdings_count': len(self.holdings)
         })
         
-        self.save_portfolio()
-        
         summary = {
             'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'initial_investment': self.initial_capital,
@@ -174,10 +299,10 @@ class PortfolioTracker:
             'absolute_return': absolute_return,
             'percentage_return': percentage_return,
             'holdings': stock_returns,
-            'winners': len([s for s in stock_returns if s['pnl'] > 0]),
-            'losers': len([s for s in stock_returns if s['pnl'] < 0]),
-            'best_performer': max(stock_returns, key=lambda x: x['return_pct']) if stock_returns else None,
-            'worst_performer': min(stock_returns, key=lambda x: x['return_pct']) if stock_returns else None
+            'winners': int(np.count_nonzero(pnl > 0)),
+            'losers': int(np.count_nonzero(pnl < 0)),
+            'best_performer': stock_returns[int(np.argmax(return_pct))] if stock_returns else None,
+            'worst_performer': stock_returns[int(np.argmin(return_pct))] if stock_returns else None
         }
         
         return summary
@@ -242,7 +367,9 @@ class PortfolioTracker:
     def get_history_summary(self) -> str:
         """Get historical performance summary"""
         
-        if len(self.history) < 2:
+        history = self.get_history(last_n=30)  # Last 30 entries
+        
+        if len(history) < 2:
             return "Not enough history data"
         
         report = []
@@ -252,13 +379,15 @@ class PortfolioTracker:
         report.append(f"{'Date':<20} {'Value':>15} {'Absolute':>15} {'Return %':>10}")
         report.append("-" * 70)
         
-        for entry in self.history[-30:]:  # Last 30 entries
-            report.append(
-                f"{entry['date']:<20} "
-                f"₹{entry['portfolio_value']:>14,.0f} "
-                f"₹{entry['absolute_return']:>+14,.0f} "
-                f"{entry['percentage_return']:>+9.2f}%"
-            )
+        report.append(history[['date', 'portfolio_value', 'absolute_return', 'percentage_return']].to_string(
+            header=False, index=False,
+            formatters={
+                'date': '{:<20}'.format,
+                'portfolio_value': '₹{:>14,.0f}'.format,
+                'absolute_return': '₹{:>+14,.0f}'.format,
+                'percentage_return': '{:>+9.2f}%'.format
+            }
+        ))
         
         report.append("=" * 70)
         
@@ -267,8 +396,12 @@ class PortfolioTracker:
     def reset_portfolio(self):
         """Reset portfolio to start fresh"""
         self.holdings = {}
-        self.history = []
+        self._holding_arrays = None
+        self.history_current_month = []
+        for shard in self._history_shards():
+            os.remove(shard)
         self.save_portfolio()
+        self._write_history()
         print("Portfolio reset successfully")
 
 
@@ -322,9 +455,11 @@ def get_portfolio_html_section(summary: dict) -> str:
     
     sorted_holdings = sorted(summary['holdings'], key=lambda x: x['return_pct'], reverse=True)
     
+    # Collect rows and join once instead of growing the string per holding
+    rows = []
     for h in sorted_holdings:
         row_class = "winner" if h['pnl'] >= 0 else "loser"
-        html += f"""
+        rows.append(f"""
             <tr class="{row_class}">
                 <td><strong>{h['symbol']}</strong></td>
                 <td>{h['quantity']}</td>
@@ -333,7 +468,9 @@ def get_portfolio_html_section(summary: dict) -> str:
                 <td class="{'positive' if h['pnl'] >= 0 else 'negative'}">₹{h['pnl']:+,.0f}</td>
                 <td class="{'positive' if h['return_pct'] >= 0 else 'negative'}">{h['return_pct']:+.2f}%</td>
             </tr>
-        """
+        """)
+    
+    html += "".join(rows)
     
     html += f"""
             <tr class="total-row">
@@ -13,25 +13,194 @@ This screener runs daily and outputs stocks with converging statistical patterns
 
 import pandas as pd
 import numpy as np
-from scipy import stats
 from datetime import datetime, timedelta
 import warnings
-import json
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from dataclasses import dataclass, field
 import os
+import hashlib
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+import orjson
+
+from quant_screener_kernels import HAVE_NUMBA, score as score_kernel
 
 warnings.filterwarnings('ignore')
 
 
+@dataclass
+class StockArrays:
+    """
+    One stock's history as NumPy arrays, derived once and shared by every signal.
+    
+    returns is the close-to-close change (len(close) - 1 values) and dow the
+    weekday of each bar.
+    """
+    close: np.ndarray
+    open_: np.ndarray
+    vol: np.ndarray
+    returns: np.ndarray
+    dow: np.ndarray
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'StockArrays':
+        """Extract the arrays from an OHLCV frame with a DatetimeIndex"""
+        close = df['close'].to_numpy(dtype=np.float64)
+        # Same arithmetic as pct_change, so scores match the Series version
+        returns = close[1:] / close[:-1] - 1
+        return cls(
+            close=close,
+            open_=df['open'].to_numpy(dtype=np.float64),
+            vol=df['volume'].to_numpy(dtype=np.float64),
+            returns=returns,
+            dow=df.index.dayofweek.to_numpy(dtype=np.int64),
+        )
+
+
+@dataclass
+class StockPanel:
+    """
+    Stocks sharing one date index, stacked as (n_stocks, n_bars) arrays.
+    
+    Row i holds the same fields StockArrays would for symbols[i]; dow is
+    shared by every row. scratch backs workspace() and is allocated on first use.
+    """
+    symbols: list
+    close: np.ndarray
+    open_: np.ndarray
+    vol: np.ndarray
+    returns: np.ndarray
+    dow: np.ndarray
+    scratch: np.ndarray = field(default=None, repr=False)
+    
+    @classmethod
+    def from_frames(cls, symbols: list, frames: list, dtype=np.float64) -> 'StockPanel':
+        """Stack OHLCV frames that all have the same DatetimeIndex, as dtype arrays"""
+        close = np.stack([df['close'].to_numpy(dtype=dtype) for df in frames])
+        return cls(
+            symbols=symbols,
+            close=close,
+            open_=np.stack([df['open'].to_numpy(dtype=dtype) for df in frames]),
+            vol=np.stack([df['volume'].to_numpy(dtype=dtype) for df in frames]),
+            returns=close[:, 1:] / close[:, :-1] - 1,
+            dow=frames[0].index.dayofweek.to_numpy(dtype=np.int64),
+        )
+    
+    def take(self, rows: list) -> 'StockPanel':
+        """Sub-panel of the given row positions"""
+        return StockPanel(
+            symbols=[self.symbols[i] for i in rows],
+            close=self.close[rows],
+            open_=self.open_[rows],
+            vol=self.vol[rows],
+            returns=self.returns[rows],
+            dow=self.dow,
+        )
+    
+    def row(self, i: int) -> StockArrays:
+        """
+        One stock of the panel as StockArrays.
+        
+        Rows are views into a float64 panel; a float32 panel's rows are
+        copied back to float64, as StockArrays (and the fused kernel's
+        signature) expect.
+        """
+        return StockArrays(
+            self.close[i].astype(np.float64, copy=False),
+            self.open_[i].astype(np.float64, copy=False),
+            self.vol[i].astype(np.float64, copy=False),
+            self.returns[i].astype(np.float64, copy=False),
+            self.dow,
+        )
+    
+    def workspace(self, *widths: int) -> tuple:
+        """
+        Contiguous (n_stocks, width) float64 scratch arrays for a signal's
+        intermediates, one per width.
+        
+        Every call carves them from the same buffer, grown only when more is
+        asked for, so their contents last until the next call.
+        """
+        n_stocks = len(self.symbols)
+        size = n_stocks * sum(widths)
+        if self.scratch is None or self.scratch.size < size:
+            self.scratch = np.empty(size, dtype=self.close.dtype)
+        
+        arrays = []
+        start = 0
+        for width in widths:
+            arrays.append(self.scratch[start:start + n_stocks * width].reshape(n_stocks, width))
+            start += n_stocks * width
+        return tuple(arrays)
+
+
+def row_mean_std(x: np.ndarray) -> tuple:
+    """
+    Per-row mean and sample (ddof=1) std of a 2D array, computed in place.
+    
+    Same arithmetic as x.mean(axis=1) and x.std(axis=1, ddof=1) but without
+    their full-size temporaries; x is left holding squared deviations.
+    """
+    n = x.shape[1]
+    mean = x.sum(axis=1, keepdims=True)
+    mean /= n
+    x -= mean
+    np.multiply(x, x, out=x)
+    var = x.sum(axis=1)
+    var /= n - 1
+    return mean[:, 0], np.sqrt(var, out=var)
+
+
+def bucket_score(x: float, lower: tuple, upper: tuple, table: tuple) -> float:
+    """
+    Table-driven form of the signals' if/elif threshold ladders.
+    
+    x is scored by how many thresholds it is strictly beyond: table[len(lower)]
+    inside the neutral band, one entry down per lower threshold above x and
+    one up per upper threshold below x. bisect is the scalar counterpart of
+    np.searchsorted; NaN compares false everywhere and scores neutral.
+    
+    Args:
+        x: Signal value
+        lower, upper: Ascending thresholds below and above the neutral band
+        table: Scores, len(lower) + 1 + len(upper) of them
+    """
+    return table[bisect_right(lower, x) + bisect_left(upper, x)]
+
+
+def bucket_scores(x: np.ndarray, lower: tuple, upper: tuple, table: tuple) -> np.ndarray:
+    """bucket_score over an array of values, one np.searchsorted per side"""
+    x = np.asarray(x)
+    idx = np.searchsorted(lower, x, side='right') + np.searchsorted(upper, x, side='left')
+    # searchsorted sorts NaN past every threshold; the ladders treat it as neutral
+    idx[np.isnan(x)] = len(lower)
+    return np.asarray(table)[idx]
+
+
 class QuantSignal:
     """Base class for all quantitative signals"""
     
+    # Bars of history the signal needs; shorter histories score 0
+    min_bars = 0
+    
     def __init__(self, name: str, weight: float = 1.0):
         self.name = name
         self.weight = weight
     
     def compute(self, df: pd.DataFrame) -> float:
         """Returns signal strength between -1 and 1"""
+        if len(df) < self.min_bars:
+            return 0.0
+        return self.compute_arrays(StockArrays.from_frame(df))
+    
+    def compute_arrays(self, arrs: StockArrays) -> float:
+        """Same as compute, on arrays already extracted into StockArrays (at least min_bars long)"""
         raise NotImplementedError
+    
+    def compute_batch(self, panel: StockPanel) -> np.ndarray:
+        """compute_arrays for every stock in a panel; subclasses vectorize it"""
+        return np.array([self.compute_arrays(panel.row(i)) for i in range(len(panel.symbols))])
 
 
 class MomentumAnomaly(QuantSignal):
@@ -44,24 +213,36 @@ class MomentumAnomaly(QuantSignal):
         super().__init__(f"momentum_{window}d", weight=1.2)
         self.window = window
     
-    def compute(self, df: pd.DataFrame) -> float:
-        if len(df) < self.window + 20:
-            return 0.0
-        
+    @property
+    def min_bars(self) -> int:
+        # The z-score needs 20 historical returns besides the latest
+        return self.window + 21
+    
+    def compute_arrays(self, arrs: StockArrays) -> float:
         # Current momentum
-        recent_return = (df['close'].iloc[-1] / df['close'].iloc[-self.window] - 1)
-        
-        # Historical distribution of same-window returns
-        historical_returns = df['close'].pct_change(self.window).dropna()[:-1]
+        recent_return = (arrs.close[-1] / arrs.close[-self.window] - 1)
         
-        if len(historical_returns) < 20:
-            return 0.0
+        # Historical distribution of same-window returns (all but the latest)
+        historical_returns = arrs.close[self.window:-1] / arrs.close[:-self.window - 1] - 1
         
         # Z-score of current momentum vs history
-        z_score = (recent_return - historical_returns.mean()) / (historical_returns.std() + 1e-8)
+        z_score = (recent_return - historical_returns.mean()) / (historical_returns.std(ddof=1) + 1e-8)
         
         # Normalize to [-1, 1]
         return np.clip(z_score / 3, -1, 1)
+    
+    def compute_batch(self, panel: StockPanel) -> np.ndarray:
+        close = panel.close
+        recent_return = close[:, -1] / close[:, -self.window] - 1
+        
+        # Historical returns go in the panel's workspace, not a fresh array
+        (buffer,) = panel.workspace(close.shape[1] - self.window - 1)
+        historical_returns = np.divide(close[:, self.window:-1], close[:, :-self.window - 1], out=buffer)
+        historical_returns -= 1
+        hist_mean, hist_std = row_mean_std(historical_returns)
+        
+        z_score = (recent_return - hist_mean) / (hist_std + 1e-8)
+        return np.clip(z_score / 3, -1, 1)
 
 
 class VolumeSpike(QuantSignal):
@@ -74,23 +255,33 @@ class VolumeSpike(QuantSignal):
         super().__init__("volume_spike", weight=1.0)
         self.lookback = lookback
     
-    def compute(self, df: pd.DataFrame) -> float:
-        if len(df) < self.lookback + 5:
-            return 0.0
-        
+    @property
+    def min_bars(self) -> int:
+        return self.lookback + 5
+    
+    def compute_arrays(self, arrs: StockArrays) -> float:
         # Recent average volume (last 3 days)
-        recent_vol = df['volume'].iloc[-3:].mean()
+        recent_vol = arrs.vol[-3:].mean()
         
         # Historical average and std
-        hist_vol = df['volume'].iloc[-(self.lookback + 3):-3]
+        hist_vol = arrs.vol[-(self.lookback + 3):-3]
+        hist_std = hist_vol.std(ddof=1)
         
-        if hist_vol.std() == 0:
+        if hist_std == 0:
             return 0.0
         
-        z_score = (recent_vol - hist_vol.mean()) / (hist_vol.std() + 1e-8)
+        z_score = (recent_vol - hist_vol.mean()) / (hist_std + 1e-8)
         
         # Only positive signals (volume expansion)
         return np.clip(z_score / 3, 0, 1)
+    
+    def compute_batch(self, panel: StockPanel) -> np.ndarray:
+        recent_vol = panel.vol[:, -3:].mean(axis=1)
+        hist_vol = panel.vol[:, -(self.lookback + 3):-3]
+        hist_std = hist_vol.std(axis=1, ddof=1)
+        
+        z_score = (recent_vol - hist_vol.mean(axis=1)) / (hist_std + 1e-8)
+        return np.where(hist_std == 0, 0.0, np.clip(z_score / 3, 0, 1))
 
 
 class VolatilityCompression(QuantSignal):
@@ -99,20 +290,24 @@ class VolatilityCompression(QuantSignal):
     Low volatility often precedes explosive moves.
     """
     
+    # Short/long volatility ratio bands: compressed below 0.8, expanded above 1.5
+    LOWER = (0.6, 0.8)
+    UPPER = (1.5,)
+    TABLE = (1.0, 0.5, 0.0, -0.5)
+    
     def __init__(self, short_window: int = 5, long_window: int = 20):
         super().__init__("vol_compression", weight=1.1)
         self.short_window = short_window
         self.long_window = long_window
     
-    def compute(self, df: pd.DataFrame) -> float:
-        if len(df) < self.long_window + 10:
-            return 0.0
-        
-        returns = df['close'].pct_change().dropna()
-        
+    @property
+    def min_bars(self) -> int:
+        return self.long_window + 10
+    
+    def compute_arrays(self, arrs: StockArrays) -> float:
         # Short-term vs long-term volatility ratio
-        short_vol = returns.iloc[-self.short_window:].std()
-        long_vol = returns.iloc[-self.long_window:].std()
+        short_vol = arrs.returns[-self.short_window:].std(ddof=1)
+        long_vol = arrs.returns[-self.long_window:].std(ddof=1)
         
         if long_vol == 0:
             return 0.0
@@ -120,15 +315,16 @@ class VolatilityCompression(QuantSignal):
         ratio = short_vol / long_vol
         
         # Compression = ratio < 1, expansion = ratio > 1
-        # We want compression (signals potential breakout)
-        if ratio < 0.6:
-            return 1.0
-        elif ratio < 0.8:
-            return 0.5
-        elif ratio > 1.5:
-            return -0.5  # Already expanded, might mean revert
-        else:
-            return 0.0
+        # We want compression (signals potential breakout); already
+        # expanded might mean revert
+        return bucket_score(ratio, self.LOWER, self.UPPER, self.TABLE)
+    
+    def compute_batch(self, panel: StockPanel) -> np.ndarray:
+        short_vol = panel.returns[:, -self.short_window:].std(axis=1, ddof=1)
+        long_vol = panel.returns[:, -self.long_window:].std(axis=1, ddof=1)
+        
+        scores = bucket_scores(short_vol / long_vol, self.LOWER, self.UPPER, self.TABLE)
+        return np.where(long_vol == 0, 0.0, scores)
 
 
 class MeanReversionSetup(QuantSignal):
@@ -137,21 +333,26 @@ class MeanReversionSetup(QuantSignal):
     Not RSI - pure statistical deviation from rolling mean.
     """
     
+    # Z-score bands: beyond +/-1.5 scores -/+0.5, beyond +/-2 scores -/+0.8
+    LOWER = (-2.0, -1.5)
+    UPPER = (1.5, 2.0)
+    TABLE = (0.8, 0.5, 0.0, -0.5, -0.8)
+    
     def __init__(self, window: int = 20):
         super().__init__("mean_reversion", weight=1.0)
         self.window = window
     
-    def compute(self, df: pd.DataFrame) -> float:
-        if len(df) < self.window + 10:
-            return 0.0
-        
-        # Current price vs rolling mean
-        rolling_mean = df['close'].rolling(self.window).mean()
-        rolling_std = df['close'].rolling(self.window).std()
+    @property
+    def min_bars(self) -> int:
+        return self.window + 10
+    
+    def compute_arrays(self, arrs: StockArrays) -> float:
+        # Current price vs its rolling mean; only the latest window is needed
+        recent = arrs.close[-self.window:]
         
-        current_price = df['close'].iloc[-1]
-        current_mean = rolling_mean.iloc[-1]
-        current_std = rolling_std.iloc[-1]
+        current_price = arrs.close[-1]
+        current_mean = recent.mean()
+        current_std = recent.std(ddof=1)
         
         if current_std == 0:
             return 0.0
@@ -160,16 +361,15 @@ class MeanReversionSetup(QuantSignal):
         
         # Mean reversion: oversold is positive signal, overbought is negative
         # (expecting price to revert)
-        if z_score < -2:
-            return 0.8  # Strongly oversold - buy signal
-        elif z_score < -1.5:
-            return 0.5
-        elif z_score > 2:
-            return -0.8  # Strongly overbought - avoid/short
-        elif z_score > 1.5:
-            return -0.5
-        else:
-            return 0.0
+        return bucket_score(z_score, self.LOWER, self.UPPER, self.TABLE)
+    
+    def compute_batch(self, panel: StockPanel) -> np.ndarray:
+        recent = panel.close[:, -self.window:]
+        current_std = recent.std(axis=1, ddof=1)
+        z_score = (panel.close[:, -1] - recent.mean(axis=1)) / current_std
+        
+        scores = bucket_scores(z_score, self.LOWER, self.UPPER, self.TABLE)
+        return np.where(current_std == 0, 0.0, scores)
 
 
 class TrendConsistency(QuantSignal):
@@ -178,25 +378,36 @@ class TrendConsistency(QuantSignal):
     Smooth trends are more reliable than choppy ones.
     """
     
+    # Bands for R-squared signed by the trend direction
+    LOWER = (-0.8, -0.6)
+    UPPER = (0.6, 0.8)
+    TABLE = (-1.0, -0.5, 0.0, 0.5, 1.0)
+    
     def __init__(self, window: int = 20):
         super().__init__("trend_quality", weight=0.8)
         self.window = window
+        # Centered regressor 0..window-1 and its sum of squares; the same
+        # for every stock, so each fit needs only the price-side sums
+        self.x_centered = np.arange(window) - (window - 1) / 2
+        self.sxx = self.x_centered.dot(self.x_centered)
     
-    def compute(self, df: pd.DataFrame) -> float:
-        if len(df) < self.window + 5:
-            return 0.0
-        
-        prices = df['close'].iloc[-self.window:].values
-        x = np.arange(len(prices))
+    @property
+    def min_bars(self) -> int:
+        return self.window + 5
+    
+    def compute_arrays(self, arrs: StockArrays) -> float:
+        prices = arrs.close[-self.window:]
         
-        # Linear regression
-        slope, intercept, r_value, p_value, std_err = stats.linregress(x, prices)
+        # Least-squares fit in closed form; slope has the sign of sxy
+        sxy = self.x_centered.dot(prices)
+        deviations = prices - prices.mean()
+        syy = deviations.dot(deviations)
         
-        # R-squared indicates trend consistency
-        r_squared = r_value ** 2
+        # R-squared indicates trend consistency (a flat window has none)
+        r_squared = sxy * sxy / (self.sxx * syy) if syy > 0 else 0.0
         
         # Combine direction and quality
-        direction = 1 if slope > 0 else -1
+        direction = 1 if sxy > 0 else -1
         
         # Only signal if trend is consistent (R² > 0.6)
         if r_squared > 0.8:
@@ -205,6 +416,16 @@ class TrendConsistency(QuantSignal):
             return direction * 0.5
         else:
             return 0.0
+    
+    def compute_batch(self, panel: StockPanel) -> np.ndarray:
+        prices = panel.close[:, -self.window:]
+        sxy = prices @ self.x_centered
+        deviations = prices - prices.mean(axis=1, keepdims=True)
+        syy = np.einsum('ij,ij->i', deviations, deviations)
+        
+        r_squared = np.where(syy > 0, sxy * sxy / (self.sxx * syy), 0.0)
+        signed_r_squared = np.where(sxy > 0, r_squared, -r_squared)
+        return bucket_scores(signed_r_squared, self.LOWER, self.UPPER, self.TABLE)
 
 
 class RelativeStrength(QuantSignal):
@@ -213,35 +434,42 @@ class RelativeStrength(QuantSignal):
     Outperformers tend to continue outperforming.
     """
     
+    # Excess-return bands: beyond +/-5% scores +/-0.5, beyond +/-10% scores +/-1
+    LOWER = (-0.1, -0.05)
+    UPPER = (0.05, 0.1)
+    TABLE = (-1.0, -0.5, 0.0, 0.5, 1.0)
+    
     def __init__(self, window: int = 20):
         super().__init__("relative_strength", weight=1.0)
         self.window = window
         self.market_returns = None  # Will be set by screener
     
+    @property
+    def min_bars(self) -> int:
+        return self.window + 5
+    
     def set_market_benchmark(self, market_df: pd.DataFrame):
         """Set market returns for comparison"""
-        self.market_returns = market_df['close'].pct_change(self.window).iloc[-1]
+        self.market_returns = float(market_df['close'].pct_change(self.window).iloc[-1])
     
-    def compute(self, df: pd.DataFrame) -> float:
-        if len(df) < self.window + 5 or self.market_returns is None:
+    def compute_arrays(self, arrs: StockArrays) -> float:
+        if self.market_returns is None:
             return 0.0
         
-        stock_return = df['close'].iloc[-1] / df['close'].iloc[-self.window] - 1
+        stock_return = arrs.close[-1] / arrs.close[-self.window] - 1
         
         # Excess return over market
         excess_return = stock_return - self.market_returns
         
         # Normalize
-        if excess_return > 0.1:
-            return 1.0
-        elif excess_return > 0.05:
-            return 0.5
-        elif excess_return < -0.1:
-            return -1.0
-        elif excess_return < -0.05:
-            return -0.5
-        else:
-            return 0.0
+        return bucket_score(excess_return, self.LOWER, self.UPPER, self.TABLE)
+    
+    def compute_batch(self, panel: StockPanel) -> np.ndarray:
+        if self.market_returns is None:
+            return np.zeros(len(panel.symbols))
+        
+        stock_return = panel.close[:, -1] / panel.close[:, -self.window] - 1
+        return bucket_scores(stock_return - self.market_returns, self.LOWER, self.UPPER, self.TABLE)
 
 
 class GapPattern(QuantSignal):
@@ -250,35 +478,33 @@ class GapPattern(QuantSignal):
     Gaps often signal institutional activity.
     """
     
+    # Average gap bands: beyond +/-1% scores +/-0.4, beyond +/-2% scores +/-0.8
+    LOWER = (-0.02, -0.01)
+    UPPER = (0.01, 0.02)
+    TABLE = (-0.8, -0.4, 0.0, 0.4, 0.8)
+    
     def __init__(self):
         super().__init__("gap_pattern", weight=0.9)
     
-    def compute(self, df: pd.DataFrame) -> float:
-        if len(df) < 10:
-            return 0.0
-        
-        # Check last 3 days for gaps
-        gaps = []
-        for i in range(-3, 0):
-            prev_close = df['close'].iloc[i - 1]
-            curr_open = df['open'].iloc[i]
-            gap_pct = (curr_open - prev_close) / prev_close
-            gaps.append(gap_pct)
+    @property
+    def min_bars(self) -> int:
+        return 10
+    
+    def compute_arrays(self, arrs: StockArrays) -> float:
+        # Check last 3 days for gaps: each open against the prior close
+        prev_close = arrs.close[-4:-1]
+        gaps = (arrs.open_[-3:] - prev_close) / prev_close
         
         # Average recent gap
-        avg_gap = np.mean(gaps)
-        
-        # Significant gap up
-        if avg_gap > 0.02:
-            return 0.8
-        elif avg_gap > 0.01:
-            return 0.4
-        elif avg_gap < -0.02:
-            return -0.8
-        elif avg_gap < -0.01:
-            return -0.4
-        else:
-            return 0.0
+        avg_gap = gaps.mean()
+        
+        # Significant gaps up score positive, gaps down negative
+        return bucket_score(avg_gap, self.LOWER, self.UPPER, self.TABLE)
+    
+    def compute_batch(self, panel: StockPanel) -> np.ndarray:
+        prev_close = panel.close[:, -4:-1]
+        avg_gap = ((panel.open_[:, -3:] - prev_close) / prev_close).mean(axis=1)
+        return bucket_scores(avg_gap, self.LOWER, self.UPPER, self.TABLE)
 
 
 class DayOfWeekEffect(QuantSignal):
@@ -290,25 +516,20 @@ class DayOfWeekEffect(QuantSignal):
     def __init__(self):
         super().__init__("day_effect", weight=0.5)
     
-    def compute(self, df: pd.DataFrame) -> float:
-        if len(df) < 60:
-            return 0.0
-        
-        df_copy = df.copy()
-        df_copy['returns'] = df_copy['close'].pct_change()
-        df_copy['day'] = df_copy.index.dayofweek
-        
+    @property
+    def min_bars(self) -> int:
+        return 60
+    
+    def compute_arrays(self, arrs: StockArrays) -> float:
         # Today's day of week
-        today = df_copy['day'].iloc[-1]
+        today = arrs.dow[-1]
         
-        # Historical returns by day of week
-        day_returns = df_copy.groupby('day')['returns'].mean()
+        # Historical returns summed per weekday (returns[i] lands on dow[i + 1])
+        day_sums = np.bincount(arrs.dow[1:], weights=arrs.returns, minlength=7)
+        day_counts = np.bincount(arrs.dow[1:], minlength=7)
         
-        if today not in day_returns.index:
-            return 0.0
-        
-        today_avg = day_returns[today]
-        overall_avg = df_copy['returns'].mean()
+        today_avg = day_sums[today] / day_counts[today]
+        overall_avg = arrs.returns.mean()
         
         # If today is historically a good day
         if today_avg > overall_avg + 0.001:
@@ -317,6 +538,15 @@ class DayOfWeekEffect(QuantSignal):
             return -0.5
         else:
             return 0.0
+    
+    def compute_batch(self, panel: StockPanel) -> np.ndarray:
+        # Every row shares the calendar, so one weekday mask serves them all
+        today = panel.dow[1:] == panel.dow[-1]
+        today_avg = panel.returns @ today / np.count_nonzero(today)
+        overall_avg = panel.returns.mean(axis=1)
+        
+        return np.where(today_avg > overall_avg + 0.001, 0.5,
+                        np.where(today_avg < overall_avg - 0.001, -0.5, 0.0))
 
 
 class PriceAcceleration(QuantSignal):
@@ -329,18 +559,19 @@ class PriceAcceleration(QuantSignal):
         super().__init__("price_acceleration", weight=0.9)
         self.window = window
     
-    def compute(self, df: pd.DataFrame) -> float:
-        if len(df) < self.window * 3:
-            return 0.0
-        
+    @property
+    def min_bars(self) -> int:
+        return self.window * 3
+    
+    def compute_arrays(self, arrs: StockArrays) -> float:
         # First derivative: momentum
-        momentum = df['close'].pct_change(self.window)
+        momentum = arrs.close[self.window:] / arrs.close[:-self.window] - 1
         
         # Second derivative: change in momentum
-        acceleration = momentum.diff(self.window)
+        acceleration = momentum[self.window:] - momentum[:-self.window]
         
-        current_accel = acceleration.iloc[-1]
-        hist_accel_std = acceleration.iloc[:-1].std()
+        current_accel = acceleration[-1]
+        hist_accel_std = acceleration[:-1].std(ddof=1)
         
         if hist_accel_std == 0:
             return 0.0
@@ -348,6 +579,20 @@ class PriceAcceleration(QuantSignal):
         z_score = current_accel / (hist_accel_std + 1e-8)
         
         return np.clip(z_score / 2, -1, 1)
+    
+    def compute_batch(self, panel: StockPanel) -> np.ndarray:
+        # Momentum and the historical accelerations live in the panel's workspace
+        n_bars = panel.close.shape[1]
+        momentum, hist_accel = panel.workspace(n_bars - self.window, n_bars - 2 * self.window - 1)
+        np.divide(panel.close[:, self.window:], panel.close[:, :-self.window], out=momentum)
+        momentum -= 1
+        
+        current_accel = momentum[:, -1] - momentum[:, -self.window - 1]
+        np.subtract(momentum[:, self.window:-1], momentum[:, :-self.window - 1], out=hist_accel)
+        _, hist_accel_std = row_mean_std(hist_accel)
+        
+        z_score = current_accel / (hist_accel_std + 1e-8)
+        return np.where(hist_accel_std == 0, 0.0, np.clip(z_score / 2, -1, 1))
 
 
 class VolumeProfileAnomaly(QuantSignal):
@@ -360,25 +605,18 @@ class VolumeProfileAnomaly(QuantSignal):
         super().__init__("volume_profile", weight=1.0)
         self.window = window
     
-    def compute(self, df: pd.DataFrame) -> float:
-        if len(df) < self.window + 5:
-            return 0.0
-        
-        recent = df.iloc[-self.window:]
-        
-        # On-balance volume approach
-        obv_changes = []
-        for i in range(1, len(recent)):
-            if recent['close'].iloc[i] > recent['close'].iloc[i-1]:
-                obv_changes.append(recent['volume'].iloc[i])
-            elif recent['close'].iloc[i] < recent['close'].iloc[i-1]:
-                obv_changes.append(-recent['volume'].iloc[i])
-            else:
-                obv_changes.append(0)
+    @property
+    def min_bars(self) -> int:
+        return self.window + 5
+    
+    def compute_arrays(self, arrs: StockArrays) -> float:
+        close_w = arrs.close[-self.window:]
+        vol_w = arrs.vol[-self.window:]
         
-        # Net volume flow
-        net_flow = sum(obv_changes)
-        avg_volume = recent['volume'].mean()
+        # On-balance volume approach: +volume on up days, -volume on down days,
+        # so the net volume flow is the direction of each move dotted with volume
+        net_flow = float(np.sign(np.diff(close_w)).dot(vol_w[1:]))
+        avg_volume = vol_w.mean()
         
         if avg_volume == 0:
             return 0.0
@@ -387,6 +625,57 @@ class VolumeProfileAnomaly(QuantSignal):
         normalized_flow = net_flow / (avg_volume * self.window)
         
         return np.clip(normalized_flow * 2, -1, 1)
+    
+    def compute_batch(self, panel: StockPanel) -> np.ndarray:
+        close_w = panel.close[:, -self.window:]
+        vol_w = panel.vol[:, -self.window:]
+        net_flow = np.einsum('ij,ij->i', np.sign(np.diff(close_w, axis=1)), vol_w[:, 1:])
+        avg_volume = vol_w.mean(axis=1)
+        
+        normalized_flow = net_flow / (avg_volume * self.window)
+        return np.where(avg_volume == 0, 0.0, np.clip(normalized_flow * 2, -1, 1))
+
+
+def _score_shard(screener, shard: list) -> tuple:
+    """
+    Worker entry point: score (symbol, StockArrays) pairs from one slice of the universe.
+    
+    Returns:
+        Tuple of (list of results, number of stocks that raised)
+    """
+    results = []
+    errors = 0
+    for symbol, arrays in shard:
+        try:
+            result = screener.score_arrays(symbol, arrays)
+            if result is not None:
+                results.append(result)
+        except Exception as e:
+            errors += 1
+            print(f"Error processing {symbol}: {e}")
+    return results, errors
+
+
+def _score_shard_in_worker(screener, shard: list) -> tuple:
+    """
+    _score_shard in a worker process.
+    
+    The worker's copy of the screener is discarded, so the score cache
+    entries it computed are returned for the parent to keep.
+    
+    Returns:
+        Tuple of (list of results, number of stocks that raised, dict of new cache entries)
+    """
+    results, errors = _score_shard(screener, shard)
+    return results, errors, screener._cache_added
+
+
+# Signal classes, in order, that quant_screener_kernels.score fuses
+KERNEL_LAYOUT = (
+    MomentumAnomaly, MomentumAnomaly, VolumeSpike, VolatilityCompression,
+    MeanReversionSetup, TrendConsistency, RelativeStrength, GapPattern,
+    DayOfWeekEffect, PriceAcceleration, VolumeProfileAnomaly,
+)
 
 
 class QuantScreener:
@@ -395,7 +684,36 @@ class QuantScreener:
     Outputs ranked list of stocks with converging patterns.
     """
     
-    def __init__(self):
+    def __init__(self, required_lookback: int = None, cache_dir: str = None,
+                 panel_dtype=np.float64, cache_max_entries: int = 100000):
+        # Bars of history score_stock needs; None keeps the full history,
+        # since several signals rank today against their whole past
+        self.required_lookback = required_lookback
+        
+        # Float type of the stacked panels. np.float32 halves their memory
+        # traffic (~2x on the panel signals at 5000 stocks) but panel scores
+        # then drift from the float64 per-stock path by up to ~1e-6, enough
+        # to tip a score sitting on a band edge, and reported prices and
+        # volumes carry float32 precision
+        self.panel_dtype = panel_dtype
+        
+        # Optional on-disk cache of raw signal scores, keyed by a hash of each
+        # stock's arrays and the signal settings (weights excluded, so
+        # re-weighting reuses it); loaded on first use. Kept in least recently
+        # used order and trimmed to cache_max_entries, as every new window of
+        # a stock's history adds an entry
+        self.cache_dir = cache_dir
+        self.cache_max_entries = cache_max_entries
+        self._score_cache = None
+        # Entries computed since the last save, which is all a worker
+        # process has to send back
+        self._cache_added = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Stocks whose scoring raised, across all scans by this screener
+        self.error_count = 0
+        
         self.signals = [
             MomentumAnomaly(window=5),
             MomentumAnomaly(window=10),
@@ -410,6 +728,8 @@ class QuantScreener:
             VolumeProfileAnomaly(window=20),
         ]
         self.results = []
+        # composite_score of each entry in results, for NumPy ranking/filtering
+        self.result_scores = np.empty(0)
     
     def set_market_benchmark(self, market_df: pd.DataFrame):
         """Set market data for relative strength calculation"""
@@ -417,6 +737,28 @@ class QuantScreener:
             if isinstance(signal, RelativeStrength):
                 signal.set_market_benchmark(market_df)
     
+    def _kernel_params(self):
+        """
+        Arguments for the fused numba kernel.
+        
+        Returns:
+            Tuple of (windows, weights, market_return), or None when numba is
+            missing or self.signals no longer matches KERNEL_LAYOUT
+        """
+        if not HAVE_NUMBA or tuple(type(s) for s in self.signals) != KERNEL_LAYOUT:
+            return None
+        
+        fast, slow, spike, compression, reversion, trend, relative, _, _, accel, profile = self.signals
+        windows = np.array([
+            fast.window, slow.window, spike.lookback,
+            compression.short_window, compression.long_window,
+            reversion.window, trend.window, relative.window,
+            accel.window, profile.window,
+        ], dtype=np.int64)
+        weights = np.array([s.weight for s in self.signals], dtype=np.float64)
+        market_return = np.nan if relative.market_returns is None else float(relative.market_returns)
+        return windows, weights, market_return
+    
     def score_stock(self, symbol: str, df: pd.DataFrame) -> dict:
         """Score a single stock across all signals"""
         
@@ -427,65 +769,296 @@ class QuantScreener:
         if not isinstance(df.index, pd.DatetimeIndex):
             df.index = pd.to_datetime(df.index)
         
-        scores = {}
-        total_weighted_score = 0
-        total_weight = 0
-        active_signals = 0
+        # Pull the arrays out once; signals index them directly
+        result = self.score_arrays(symbol, StockArrays.from_frame(df))
         
-        for signal in self.signals:
-            try:
-                score = signal.compute(df)
-                scores[signal.name] = round(score, 3)
+        # scan_universe stamps its results itself, with one time per scan
+        if result is not None:
+            result['scan_date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return result
+    
+    def score_arrays(self, symbol: str, arrs: StockArrays) -> dict:
+        """Same as score_stock, on arrays already extracted into StockArrays"""
+        
+        close = arrs.close
+        if len(close) < 60:
+            return None
+        
+        if self.cache_dir is not None:
+            # One-row panel, so the cached path has a single implementation
+            panel = StockPanel([symbol], close[None], arrs.open_[None], arrs.vol[None],
+                               arrs.returns[None], arrs.dow)
+            return self.score_panel(panel).get(symbol)
+        
+        kernel_params = self._kernel_params()
+        if kernel_params is not None:
+            windows, weights, market_return = kernel_params
+            if weights.sum() == 0:
+                return None
+            
+            # Default signal set: one fused pass, convergence bonus included
+            composite_score, active_signals, breakdown = score_kernel(
+                np.ascontiguousarray(close), np.ascontiguousarray(arrs.open_),
+                np.ascontiguousarray(arrs.vol), arrs.dow, market_return, windows, weights)
+            scores = dict(zip([signal.name for signal in self.signals], breakdown.tolist()))
+        else:
+            scores = {}
+            total_weighted_score = 0
+            total_weight = 0
+            active_signals = 0
+            
+            for signal in self.signals:
+                # Too short a history scores 0 without reaching the signal
+                score = signal.compute_arrays(arrs) if len(close) >= signal.min_bars else 0.0
+                scores[signal.name] = score
                 total_weighted_score += score * signal.weight
                 total_weight += signal.weight
                 if abs(score) > 0.3:
                     active_signals += 1
-            except Exception as e:
-                scores[signal.name] = 0.0
+            
+            if total_weight == 0:
+                return None
+            
+            composite_score = total_weighted_score / total_weight
+            
+            # Signal convergence bonus
+            # Multiple signals agreeing = higher confidence
+            if active_signals >= 5:
+                convergence_bonus = 0.2
+            elif active_signals >= 3:
+                convergence_bonus = 0.1
+            else:
+                convergence_bonus = 0
+            
+            # Apply convergence bonus only if signals agree; agreement counts
+            # scores beyond +/-0.3 as shown to 3 decimals
+            positive_signals = sum(1 for s in scores.values() if round(s, 3) > 0.3)
+            negative_signals = sum(1 for s in scores.values() if round(s, 3) < -0.3)
+            
+            if positive_signals > negative_signals:
+                composite_score += convergence_bonus
+            elif negative_signals > positive_signals:
+                composite_score -= convergence_bonus
         
-        if total_weight == 0:
-            return None
+        # Full precision; rounding is left to the reports
+        return {
+            'symbol': symbol,
+            'composite_score': float(composite_score),
+            'active_signals': active_signals,
+            'signal_breakdown': scores,
+            'last_price': float(close[-1]),
+            'change_1d': float((close[-1] / close[-2] - 1) * 100),
+            'change_5d': float((close[-1] / close[-5] - 1) * 100) if len(close) >= 5 else 0,
+            'avg_volume': int(arrs.vol[-20:].mean()),
+            'volatility_20d': float(arrs.returns[-20:].std(ddof=1) * 100),
+        }
+    
+    def build_panels(self, stock_data: dict) -> tuple:
+        """
+        Group the universe by date index and stack each group into a StockPanel.
         
-        composite_score = total_weighted_score / total_weight
+        Stocks whose index no other stock shares (a later listing, missing
+        bars) are returned separately for the per-stock path.
+        
+        Args:
+            stock_data: Dict of {symbol: DataFrame}
+        
+        Returns:
+            Tuple of (list of StockPanel, dict of {symbol: DataFrame} left over)
+        """
+        groups = {}
+        for symbol, df in stock_data.items():
+            if len(df) < 60:
+                continue
+            if not isinstance(df.index, pd.DatetimeIndex):
+                df.index = pd.to_datetime(df.index)
+            
+            # Cheap key first; equals() only runs against same-shaped indexes
+            candidates = groups.setdefault((len(df), df.index[0], df.index[-1]), [])
+            for index, members in candidates:
+                if index.equals(df.index):
+                    members.append((symbol, df))
+                    break
+            else:
+                candidates.append((df.index, [(symbol, df)]))
+        
+        panels = []
+        singles = {}
+        for candidates in groups.values():
+            for _, members in candidates:
+                if len(members) > 1:
+                    try:
+                        panels.append(StockPanel.from_frames([m[0] for m in members], [m[1] for m in members],
+                                                             dtype=self.panel_dtype))
+                        continue
+                    except Exception:
+                        pass  # e.g. a missing column; score_stock reports it per symbol
+                singles.update(members)
+        
+        return panels, singles
+    
+    def score_panel(self, panel: StockPanel) -> dict:
+        """
+        Score every stock in a panel, one vectorized pass per signal.
         
-        # Signal convergence bonus
-        # Multiple signals agreeing = higher confidence
-        if active_signals >= 5:
-            convergence_bonus = 0.2
-        elif active_signals >= 3:
-            convergence_bonus = 0.1
+        Returns:
+            Dict of {symbol: result} in the same format as score_stock
+        """
+        if self.cache_dir is None:
+            score_matrix = self._signal_matrix(panel)
         else:
-            convergence_bonus = 0
+            score_matrix = self._cached_signal_matrix(panel)
         
-        # Apply convergence bonus only if signals agree
-        positive_signals = sum(1 for s in scores.values() if s > 0.3)
-        negative_signals = sum(1 for s in scores.values() if s < -0.3)
+        weights = [signal.weight for signal in self.signals]
+        total_weight = sum(weights)
+        if total_weight == 0:
+            return {}
+        
+        # The composite is one GEMV over the (n_stocks, n_signals) scores
+        composite = score_matrix @ np.array(weights) / total_weight
+        
+        # Convergence bonus, signed by which side more signals agree on
+        # (scores beyond +/-0.3 as shown to 3 decimals)
+        active = np.count_nonzero(np.abs(score_matrix) > 0.3, axis=1)
+        shown = score_matrix.round(3)
+        positive = np.count_nonzero(shown > 0.3, axis=1)
+        negative = np.count_nonzero(shown < -0.3, axis=1)
+        bonus = np.where(active >= 5, 0.2, np.where(active >= 3, 0.1, 0.0))
+        composite += np.sign(positive - negative) * bonus
+        
+        close = panel.close
+        last_price = close[:, -1].tolist()
+        change_1d = ((close[:, -1] / close[:, -2] - 1) * 100).tolist()
+        change_5d = ((close[:, -1] / close[:, -5] - 1) * 100).tolist()
+        avg_volume = panel.vol[:, -20:].mean(axis=1).astype(np.int64).tolist()
+        volatility = (panel.returns[:, -20:].std(axis=1, ddof=1) * 100).tolist()
+        composite = composite.tolist()
+        active = active.tolist()
+        
+        names = [signal.name for signal in self.signals]
+        results = {}
+        for i, (symbol, row) in enumerate(zip(panel.symbols, score_matrix.tolist())):
+            results[symbol] = {
+                'symbol': symbol,
+                'composite_score': composite[i],
+                'active_signals': active[i],
+                'signal_breakdown': dict(zip(names, row)),
+                'last_price': last_price[i],
+                'change_1d': change_1d[i],
+                'change_5d': change_5d[i],
+                'avg_volume': avg_volume[i],
+                'volatility_20d': volatility[i],
+            }
+        return results
+    
+    def _signal_matrix(self, panel: StockPanel) -> np.ndarray:
+        """Raw (n_stocks, n_signals) scores for a panel"""
+        n_stocks, n_bars = panel.close.shape
+        columns = []
+        for signal in self.signals:
+            if n_bars >= signal.min_bars:
+                columns.append(signal.compute_batch(panel))
+            else:
+                columns.append(np.zeros(n_stocks))
+        return np.column_stack(columns)
+    
+    def _cached_signal_matrix(self, panel: StockPanel) -> np.ndarray:
+        """_signal_matrix, computing only the rows missing from the score cache"""
+        if self._score_cache is None:
+            self._score_cache = self._load_score_cache()
+        
+        # Everything besides the arrays that the raw scores depend on
+        settings = repr([
+            (type(signal).__name__, sorted((k, v) for k, v in vars(signal).items()
+                                           if k != 'weight' and not isinstance(v, np.ndarray)))
+            for signal in self.signals
+        ]).encode() + panel.dow.tobytes()
+        
+        keys = []
+        for i in range(len(panel.symbols)):
+            # Rows of a one-stock panel can be strided views of a frame
+            h = hashlib.blake2b(settings, digest_size=16)
+            h.update(np.ascontiguousarray(panel.close[i]))
+            h.update(np.ascontiguousarray(panel.open_[i]))
+            h.update(np.ascontiguousarray(panel.vol[i]))
+            keys.append(h.digest())
+        
+        score_matrix = np.empty((len(panel.symbols), len(self.signals)))
+        missing = []
+        for i, key in enumerate(keys):
+            cached = self._score_cache.pop(key, None)
+            if cached is None:
+                missing.append(i)
+            else:
+                # Reinserted, so the entry moves to the most recently used end
+                self._score_cache[key] = cached
+                score_matrix[i] = cached
         
-        if positive_signals > negative_signals:
-            composite_score += convergence_bonus
-        elif negative_signals > positive_signals:
-            composite_score -= convergence_bonus
+        self.cache_hits += len(keys) - len(missing)
+        self.cache_misses += len(missing)
         
+        if missing:
+            computed = self._signal_matrix(panel.take(missing))
+            score_matrix[missing] = computed
+            added = {keys[i]: row for i, row in zip(missing, computed)}
+            self._add_cache_entries(added)
+        
+        return score_matrix
+    
+    def _add_cache_entries(self, entries: dict):
+        """Store new score cache entries, evicting the least recently used beyond cache_max_entries"""
+        if self._score_cache is None:
+            self._score_cache = self._load_score_cache()
+        
+        self._score_cache.update(entries)
+        self._cache_added.update(entries)
+        
+        excess = len(self._score_cache) - self.cache_max_entries
+        if excess > 0:
+            for key in list(islice(self._score_cache, excess)):
+                del self._score_cache[key]
+    
+    def _load_score_cache(self) -> dict:
+        """Read the score cache from cache_dir (empty if there is none yet)"""
+        path = os.path.join(self.cache_dir, 'signal_scores.pkl')
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable score cache {path}: {e}")
+            return {}
+    
+    def save_score_cache(self):
+        """Write new score cache entries to cache_dir (scan_universe calls this)"""
+        if self.cache_dir is None or not self._cache_added:
+            return
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, 'signal_scores.pkl')
+        with open(path + '.tmp', 'wb') as f:
+            pickle.dump(self._score_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + '.tmp', path)
+        self._cache_added = {}
+    
+    def get_cache_stats(self) -> dict:
+        """Score cache hits, misses and stored entries since this screener was created"""
         return {
-            'symbol': symbol,
-            'composite_score': round(composite_score, 4),
-            'active_signals': active_signals,
-            'signal_breakdown': scores,
-            'last_price': round(df['close'].iloc[-1], 2),
-            'change_1d': round((df['close'].iloc[-1] / df['close'].iloc[-2] - 1) * 100, 2),
-            'change_5d': round((df['close'].iloc[-1] / df['close'].iloc[-5] - 1) * 100, 2) if len(df) >= 5 else 0,
-            'avg_volume': int(df['volume'].iloc[-20:].mean()),
-            'volatility_20d': round(df['close'].pct_change().iloc[-20:].std() * 100, 2),
-            'scan_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'entries': len(self._score_cache) if self._score_cache is not None else 0,
         }
     
-    def scan_universe(self, stock_data: dict, market_data: pd.DataFrame = None) -> list:
+    def scan_universe(self, stock_data: dict, market_data: pd.DataFrame = None,
+                      n_jobs: int = 1) -> list:
         """
         Scan entire universe of stocks.
         
         Args:
             stock_data: Dict of {symbol: DataFrame}
             market_data: Optional market index data for relative strength
+            n_jobs: Worker processes to score in (1 = serial)
         
         Returns:
             Sorted list of stock results
@@ -494,31 +1067,93 @@ class QuantScreener:
         if market_data is not None:
             self.set_market_benchmark(market_data)
         
-        results = []
+        if n_jobs > 1 and len(stock_data) > 1:
+            results = self._parallel_scan(stock_data, n_jobs)
+        else:
+            # Stocks on a shared calendar are scored as panels; the rest one by one
+            panels, singles = self.build_panels(stock_data)
+            
+            scored = {}
+            for panel in panels:
+                try:
+                    scored.update(self.score_panel(panel))
+                except Exception:
+                    # Rescore stock by stock, so the error is pinned on its symbol
+                    rows = [(symbol, panel.row(i)) for i, symbol in enumerate(panel.symbols)]
+                    results, errors = _score_shard(self, rows)
+                    scored.update((result['symbol'], result) for result in results)
+                    self.error_count += errors
+            
+            for symbol, df in singles.items():
+                try:
+                    result = self.score_stock(symbol, df)
+                    if result is not None:
+                        scored[symbol] = result
+                except Exception as e:
+                    self.error_count += 1
+                    print(f"Error processing {symbol}: {e}")
+                    continue
+            
+            # Universe order, so stocks with equal scores rank as before
+            results = [scored[symbol] for symbol in stock_data if symbol in scored]
+        
+        # Sort by composite score (descending); a stable argsort of the
+        # negated scores keeps equal scores in universe order
+        scores = np.fromiter((r['composite_score'] for r in results), dtype=np.float64, count=len(results))
+        order = np.argsort(-scores, kind='stable')
+        results = [results[i] for i in order]
         
+        scan_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        for result in results:
+            result['scan_date'] = scan_date
+        
+        self.save_score_cache()
+        self.results = results
+        self.result_scores = scores[order]
+        return results
+    
+    def _parallel_scan(self, stock_data: dict, n_jobs: int) -> list:
+        """
+        Score the universe in n_jobs contiguous symbol shards across processes.
+        
+        Workers get StockArrays rather than DataFrames, which pickle as
+        raw buffers; shards come back in order so ties rank as in a serial scan.
+        """
+        items = []
         for symbol, df in stock_data.items():
+            if len(df) < 60:
+                continue
             try:
-                result = self.score_stock(symbol, df)
-                if result is not None:
-                    results.append(result)
+                if not isinstance(df.index, pd.DatetimeIndex):
+                    df.index = pd.to_datetime(df.index)
+                items.append((symbol, StockArrays.from_frame(df)))
             except Exception as e:
+                self.error_count += 1
                 print(f"Error processing {symbol}: {e}")
-                continue
         
-        # Sort by composite score (descending)
-        results.sort(key=lambda x: x['composite_score'], reverse=True)
+        shard_size = max(1, -(-len(items) // n_jobs))
+        shards = [items[start:start + shard_size] for start in range(0, len(items), shard_size)]
         
-        self.results = results
+        results = []
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            for shard_results, errors, cache_entries in executor.map(
+                    _score_shard_in_worker, [self] * len(shards), shards):
+                results.extend(shard_results)
+                self.error_count += errors
+                if cache_entries:
+                    self._add_cache_entries(cache_entries)
         return results
     
     def get_top_stocks(self, n: int = 20, min_score: float = 0.2) -> list:
         """Get top N stocks with minimum score threshold"""
-        return [r for r in self.results if r['composite_score'] >= min_score][:n]
+        rows = np.flatnonzero(self.result_scores >= min_score)[:n]
+        return [self.results[i] for i in rows]
     
     def get_bottom_stocks(self, n: int = 10, max_score: float = -0.2) -> list:
         """Get bottom N stocks (short candidates)"""
-        bottom = [r for r in self.results if r['composite_score'] <= max_score]
-        return sorted(bottom, key=lambda x: x['composite_score'])[:n]
+        rows = np.flatnonzero(self.result_scores <= max_score)
+        rows = rows[np.argsort(self.result_scores[rows], kind='stable')][:n]
+        return [self.results[i] for i in rows]
     
     def generate_report(self) -> str:
         """Generate text report of scan results"""
@@ -580,13 +1215,14 @@ class QuantScreener:
     
     def save_results(self, filepath: str):
         """Save results to JSON file"""
-        with open(filepath, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     def load_results(self, filepath: str):
         """Load results from JSON file"""
-        with open(filepath, 'r') as f:
-            self.results = json.load(f)
+        with open(filepath, 'rb') as f:
+            self.results = orjson.loads(f.read())
+        self.result_scores = np.array([r['composite_score'] for r in self.results], dtype=np.float64)
 
 
 # Utility function for detailed stock analysis
@@ -603,7 +1239,7 @@ def analyze_stock_detail(screener: QuantScreener, symbol: str, df: pd.DataFrame)
     analysis.append(f"{'='*50}")
     analysis.append(f"Composite Score: {result['composite_score']:.4f}")
     analysis.append(f"Active Signals: {result['active_signals']}")
-    analysis.append(f"Last Price: {result['last_price']}")
+    analysis.append(f"Last Price: {result['last_price']:.2f}")
     analysis.append(f"1-Day Change: {result['change_1d']:.2f}%")
     analysis.append(f"5-Day Change: {result['change_5d']:.2f}%")
     analysis.append(f"20-Day Volatility: {result['volatility_20d']:.2f}%")
@@ -0,0 +1,299 @@
+"""
+Numba kernels for the quantitative screener.
+
+score() fuses QuantScreener's default signal set into a single pass over one
+stock's arrays. Each block mirrors the compute_arrays method of the signal it
+replaces in quant_screener.py - keep the two in step when changing a signal.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; QuantScreener falls back to per-signal NumPy
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Every fast-math flag except nnan/ninf: the signals test for NaN
+# (e.g. a missing market benchmark) and must keep seeing it
+FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# Signals in the order score() fills its breakdown array
+N_SIGNALS = 11
+
+SIGNATURE = ('Tuple((float64, int64, float64[::1]))'
+             '(float64[::1], float64[::1], float64[::1], int64[::1], float64, int64[::1], float64[::1])')
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _clip(x, lo, hi):
+    return min(max(x, lo), hi)
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _mean_std(a, start, end):
+    """Mean and sample (ddof=1) standard deviation of a[start:end]"""
+    n = end - start
+    total = 0.0
+    for i in range(start, end):
+        total += a[i]
+    mean = total / n
+    
+    sq = 0.0
+    for i in range(start, end):
+        d = a[i] - mean
+        sq += d * d
+    return mean, np.sqrt(sq / (n - 1))
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _ratio_mean_std(close, lag, start, end):
+    """
+    Mean and sample std of close[t] / close[t - lag] - 1 for t in [start, end).
+    
+    The lagged returns are generated on the fly rather than materialized.
+    """
+    n = end - start
+    total = 0.0
+    for t in range(start, end):
+        total += close[t] / close[t - lag] - 1
+    mean = total / n
+    
+    sq = 0.0
+    for t in range(start, end):
+        d = close[t] / close[t - lag] - 1 - mean
+        sq += d * d
+    return mean, np.sqrt(sq / (n - 1))
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _acceleration(close, t, w):
+    """Change in w-bar momentum over the last w bars, at bar t (t >= 2w)"""
+    return (close[t] / close[t - w] - 1) - (close[t - w] / close[t - 2 * w] - 1)
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _linregress_slope_r2(y, start, end):
+    """
+    Slope and R-squared of y[start:end] regressed on 0, 1, 2, ...
+    
+    Closed form over centered sums; centering keeps a flat window at
+    exactly zero variance instead of a cancellation residue.
+    """
+    n = end - start
+    x_mean = (n - 1) / 2.0
+    y_mean = 0.0
+    for i in range(start, end):
+        y_mean += y[i]
+    y_mean /= n
+    
+    sxx = n * (n * n - 1) / 12.0
+    sxy = 0.0
+    syy = 0.0
+    for i in range(start, end):
+        dy = y[i] - y_mean
+        sxy += (i - start - x_mean) * dy
+        syy += dy * dy
+    
+    if syy == 0:
+        return 0.0, 0.0
+    return sxy / sxx, sxy * sxy / (sxx * syy)
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _obv_flow(close, vol, w):
+    """Net on-balance volume over the last w bars"""
+    n = len(close)
+    flow = 0.0
+    for i in range(n - w + 1, n):
+        # Branchless: the sign of the move picks +vol, -vol or nothing
+        flow += np.sign(close[i] - close[i - 1]) * vol[i]
+    return flow
+
+
+@njit(SIGNATURE, cache=True, fastmath=FASTMATH)
+def score(close, open_, vol, dow, mkt_ret, windows, weights):
+    """
+    Score one stock on the default signal set.
+    
+    Args:
+        close, open_, vol: Contiguous float64 price/volume history
+        dow: Weekday of each bar (int64)
+        mkt_ret: Market return over the relative-strength window, NaN if unset
+        windows: int64 [momentum_fast, momentum_slow, volume_lookback,
+                 vol_short, vol_long, mean_reversion, trend, relative_strength,
+                 acceleration, volume_profile]
+        weights: float64 weight per signal, in breakdown order
+    
+    Returns:
+        Tuple of (composite_score, active_signals, breakdown)
+    """
+    n = len(close)
+    s = np.zeros(N_SIGNALS)
+    
+    # 0, 1: momentum anomalies - latest w-bar return vs its own history
+    for k in range(2):
+        w = windows[k]
+        if n >= w + 20 and n - w - 1 >= 20:
+            recent = close[n - 1] / close[n - w] - 1
+            mean, std = _ratio_mean_std(close, w, w, n - 1)
+            s[k] = _clip((recent - mean) / (std + 1e-8) / 3, -1.0, 1.0)
+    
+    # 2: volume spike - last 3 bars vs the lookback before them
+    lookback = windows[2]
+    if n >= lookback + 5:
+        recent_vol, _ = _mean_std(vol, n - 3, n)
+        hist_mean, hist_std = _mean_std(vol, n - lookback - 3, n - 3)
+        if hist_std != 0:
+            s[2] = _clip((recent_vol - hist_mean) / (hist_std + 1e-8) / 3, 0.0, 1.0)
+    
+    # 3: volatility compression - short vs long std of daily returns
+    short_w = windows[3]
+    long_w = windows[4]
+    if n >= long_w + 10:
+        _, short_vol = _ratio_mean_std(close, 1, n - short_w, n)
+        _, long_vol = _ratio_mean_std(close, 1, n - long_w, n)
+        if long_vol != 0:
+            ratio = short_vol / long_vol
+            if ratio < 0.6:
+                s[3] = 1.0
+            elif ratio < 0.8:
+                s[3] = 0.5
+            elif ratio > 1.5:
+                s[3] = -0.5
+    
+    # 4: mean reversion - z-score of the close within its last window
+    w = windows[5]
+    if n >= w + 10:
+        mean, std = _mean_std(close, n - w, n)
+        if std != 0:
+            z = (close[n - 1] - mean) / std
+            if z < -2:
+                s[4] = 0.8
+            elif z < -1.5:
+                s[4] = 0.5
+            elif z > 2:
+                s[4] = -0.8
+            elif z > 1.5:
+                s[4] = -0.5
+    
+    # 5: trend quality - direction and R-squared of a linear fit
+    w = windows[6]
+    if n >= w + 5:
+        slope, r2 = _linregress_slope_r2(close, n - w, n)
+        direction = 1.0 if slope > 0 else -1.0
+        if r2 > 0.8:
+            s[5] = direction
+        elif r2 > 0.6:
+            s[5] = direction * 0.5
+    
+    # 6: relative strength - excess return over the market
+    w = windows[7]
+    if n >= w + 5 and not np.isnan(mkt_ret):
+        excess = close[n - 1] / close[n - w] - 1 - mkt_ret
+        if excess > 0.1:
+            s[6] = 1.0
+        elif excess > 0.05:
+            s[6] = 0.5
+        elif excess < -0.1:
+            s[6] = -1.0
+        elif excess < -0.05:
+            s[6] = -0.5
+    
+    # 7: gap pattern - average open-vs-prior-close gap over 3 bars
+    if n >= 10:
+        gap = 0.0
+        for i in range(n - 3, n):
+            gap += (open_[i] - close[i - 1]) / close[i - 1]
+        gap /= 3
+        if gap > 0.02:
+            s[7] = 0.8
+        elif gap > 0.01:
+            s[7] = 0.4
+        elif gap < -0.02:
+            s[7] = -0.8
+        elif gap < -0.01:
+            s[7] = -0.4
+    
+    # 8: day-of-week effect - today's weekday average vs all days
+    if n >= 60:
+        today = dow[n - 1]
+        total = 0.0
+        today_total = 0.0
+        today_count = 0
+        for i in range(1, n):
+            r = close[i] / close[i - 1] - 1
+            total += r
+            if dow[i] == today:
+                today_total += r
+                today_count += 1
+        today_avg = today_total / today_count
+        overall_avg = total / (n - 1)
+        if today_avg > overall_avg + 0.001:
+            s[8] = 0.5
+        elif today_avg < overall_avg - 0.001:
+            s[8] = -0.5
+    
+    # 9: price acceleration - latest momentum change vs its history
+    w = windows[8]
+    if n >= 3 * w:
+        # One pass with Welford's running mean/variance, so each historical
+        # acceleration is computed once rather than once per moment
+        mean = 0.0
+        sq = 0.0
+        m = 0
+        for t in range(2 * w, n - 1):
+            accel = _acceleration(close, t, w)
+            m += 1
+            d = accel - mean
+            mean += d / m
+            sq += d * (accel - mean)
+        std = np.sqrt(sq / (m - 1))
+        if std != 0:
+            s[9] = _clip(_acceleration(close, n - 1, w) / (std + 1e-8) / 2, -1.0, 1.0)
+    
+    # 10: volume profile - net on-balance volume vs average volume
+    w = windows[9]
+    if n >= w + 5:
+        avg_volume, _ = _mean_std(vol, n - w, n)
+        if avg_volume != 0:
+            s[10] = _clip(_obv_flow(close, vol, w) / (avg_volume * w) * 2, -1.0, 1.0)
+    
+    # Weighted composite with scalar accumulators
+    weighted = 0.0
+    total_weight = 0.0
+    active = 0
+    positive = 0
+    negative = 0
+    for k in range(N_SIGNALS):
+        weighted += s[k] * weights[k]
+        total_weight += weights[k]
+        if abs(s[k]) > 0.3:
+            active += 1
+        # Agreement is judged on the 3-decimal scores that get reported
+        reported = np.round(s[k], 3)
+        if reported > 0.3:
+            positive += 1
+        elif reported < -0.3:
+            negative += 1
+    
+    composite = weighted / total_weight
+    
+    # Convergence bonus, signed by whichever side has more signals
+    bonus = 0.0
+    if active >= 5:
+        bonus = 0.2
+    elif active >= 3:
+        bonus = 0.1
+    if positive > negative:
+        composite += bonus
+    elif negative > positive:
+        composite -= bonus
+    
+    return composite, active, s
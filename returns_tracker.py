@@ -4,14 +4,18 @@ Returns Tracker Module
 ======================
 
 Tracks actual daily returns from the screener picks and compounds them over time.
-Stores history in JSON for accurate performance measurement.
+Stores history in JSON for accurate performance measurement, in Parquet when
+the history file ends in .parquet, or as an append-only log of one JSON line per
+day when it ends in .jsonl. The last two keep the scalars in a small JSON sidecar.
 """
 
-import json
+import bisect
 import os
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-import pandas as pd
+import numpy as np
+import orjson
 
 
 class ReturnsTracker:
@@ -20,18 +24,74 @@ class ReturnsTracker:
     Compounds returns over time for accurate performance measurement.
     """
     
+    # Fixed attribute set: no per-instance __dict__, and attribute reads are
+    # slot lookups on the hot record/summary paths
+    __slots__ = ('history_file', 'initial_capital', '_parquet', '_jsonl', '_meta_file',
+                 '_persisted_days', '_history', '_dates', '_date_index', '_summary_cache',
+                 '_stats', '_dirty', '_last_flush_ts')
+    
     def __init__(self, history_file: str = "./output/returns_history.json", 
                  initial_capital: float = 1000000):
         self.history_file = history_file
         self.initial_capital = initial_capital
-        self.history = self._load_history()
+        
+        # A .parquet history keeps daily_returns and the equity curves as
+        # columns, a .jsonl history as one line per day that flush() only
+        # appends to; either way the scalars live in <name>.meta.json
+        self._parquet = history_file.endswith('.parquet')
+        self._jsonl = history_file.endswith('.jsonl')
+        self._meta_file = os.path.splitext(history_file)[0] + '.meta.json'
+        
+        # Days of a .jsonl history already in the file; 0 makes the next
+        # flush rewrite it
+        self._persisted_days = 0
+        
+        # The file is read on first use of .history, not here, so creating
+        # a tracker that is never queried costs nothing
+        self._history = None
+        
+        # Writes are batched: changes mark the history dirty and reach disk
+        # at most once a second, on flush(), or when the tracker goes away.
+        # The first change is written straight away.
+        self._dirty = False
+        self._last_flush_ts = float('-inf')
+        
+        # Ensure history directory exists
+        os.makedirs(os.path.dirname(os.path.abspath(history_file)), exist_ok=True)
+    
+    @property
+    def history(self) -> dict:
+        """The returns history, loaded from file on first access"""
+        if self._history is None:
+            self._set_history(self._load_history())
+        return self._history
+    
+    def _set_history(self, history: dict):
+        """Install a history dict and rebuild everything derived from it"""
+        self._history = history
+        
+        # Date column of daily_returns, in order (equity curve labels), and
+        # as a set for O(1) duplicate checks
+        self._dates = [r['date'] for r in history['daily_returns']]
+        self._date_index = set(self._dates)
+        
+        # (key, summary) of the last get_performance_summary call; cleared
+        # whenever the history changes
+        self._summary_cache = None
+        
+        # Running aggregates for the summary, kept up to date by _append_day
+        self._stats = self._build_stats()
     
     def _load_history(self) -> dict:
         """Load existing returns history from file"""
         if os.path.exists(self.history_file):
             try:
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
+                if self._parquet:
+                    return self._read_parquet_history()
+                if self._jsonl:
+                    return self._read_jsonl_history()
+                with open(self.history_file, 'rb') as f:
+                    return orjson.loads(f.read())
             except:
                 pass
         
@@ -46,11 +106,143 @@ class ReturnsTracker:
             "total_market_return_pct": 0
         }
     
-    def _save_history(self):
-        """Save history to file"""
-        os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
-        with open(self.history_file, 'w') as f:
-            json.dump(self.history, f, indent=2)
+    def _read_parquet_history(self) -> dict:
+        """Reassemble the history dict from the Parquet table and its sidecar"""
+        # pandas is only needed for Parquet, so JSON users never pay to import it
+        import pandas as pd
+        
+        with open(self._meta_file, 'rb') as f:
+            history = orjson.loads(f.read())
+        
+        df = pd.read_parquet(self.history_file)
+        history['strategy_equity'] = [history.pop('initial_strategy_equity')] + df.pop('strategy_equity').tolist()
+        history['market_equity'] = [history.pop('initial_market_equity')] + df.pop('market_equity').tolist()
+        history['daily_returns'] = df.to_dict('records')
+        return history
+    
+    def _write_parquet_history(self):
+        """Write daily_returns plus the equity after each day as one table, the rest as the sidecar"""
+        import pandas as pd
+        
+        df = pd.DataFrame(self.history['daily_returns'])
+        df['strategy_equity'] = self.history['strategy_equity'][1:]
+        df['market_equity'] = self.history['market_equity'][1:]
+        
+        tmp_file = self.history_file + '.tmp'
+        df.to_parquet(tmp_file, compression='zstd', index=False)
+        os.replace(tmp_file, self.history_file)
+        
+        self._write_meta()
+    
+    def _read_jsonl_history(self) -> dict:
+        """Reassemble the history dict from the day log and its sidecar"""
+        with open(self._meta_file, 'rb') as f:
+            history = orjson.loads(f.read())
+        
+        with open(self.history_file, 'rb') as f:
+            lines = [line for line in f if line.strip()]
+        
+        records = []
+        torn = False
+        for i, line in enumerate(lines):
+            try:
+                records.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                if i < len(lines) - 1:
+                    raise
+                # An append cut short mid-line; skip it
+                torn = True
+        
+        history['strategy_equity'] = [history.pop('initial_strategy_equity')] + [r.pop('strategy_equity') for r in records]
+        history['market_equity'] = [history.pop('initial_market_equity')] + [r.pop('market_equity') for r in records]
+        history['daily_returns'] = records
+        
+        # After a torn append the next flush rewrites the log without it
+        self._persisted_days = 0 if torn else len(records)
+        return history
+    
+    def _write_jsonl_history(self):
+        """Append the days not yet in the log, then rewrite the sidecar"""
+        start = self._persisted_days
+        lines = [orjson.dumps(dict(record, strategy_equity=strategy, market_equity=market),
+                              option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+                 for record, strategy, market in zip(self.history['daily_returns'][start:],
+                                                     self.history['strategy_equity'][start + 1:],
+                                                     self.history['market_equity'][start + 1:])]
+        
+        if start:
+            with open(self.history_file, 'ab') as f:
+                f.writelines(lines)
+        else:
+            tmp_file = self.history_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.writelines(lines)
+            os.replace(tmp_file, self.history_file)
+        self._persisted_days = len(self.history['daily_returns'])
+        
+        self._write_meta()
+    
+    def _write_meta(self):
+        """Write everything but the per-day columns to the sidecar"""
+        meta = {k: v for k, v in self.history.items()
+                if k not in ('daily_returns', 'strategy_equity', 'market_equity')}
+        meta['initial_strategy_equity'] = self.history['strategy_equity'][0]
+        meta['initial_market_equity'] = self.history['market_equity'][0]
+        
+        with open(self._meta_file + '.tmp', 'wb') as f:
+            f.write(orjson.dumps(meta, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        os.replace(self._meta_file + '.tmp', self._meta_file)
+    
+    def _build_stats(self) -> dict:
+        """Summary aggregates computed from scratch over the whole history"""
+        strategy_returns = [r['strategy_return_pct'] for r in self.history['daily_returns']]
+        strategy_equity = self.history['strategy_equity']
+        return {
+            'sum_strategy_returns': sum(strategy_returns),
+            'winning_days': sum(1 for r in strategy_returns if r > 0),
+            'best_day': max(strategy_returns, default=None),
+            'worst_day': min(strategy_returns, default=None),
+            'max_equity': max(strategy_equity),
+            'min_equity': min(strategy_equity),
+        }
+    
+    def _mark_dirty(self):
+        """Note unsaved changes; writes them if the last write was over a second ago"""
+        self._dirty = True
+        if time.monotonic() - self._last_flush_ts > 1.0:
+            self.flush()
+    
+    def flush(self):
+        """Write pending history changes to file"""
+        if not self._dirty:
+            return
+        
+        # Temp file + rename, so a crash mid-write never truncates the history
+        # (a .jsonl log is only appended to, and its reader skips a torn line)
+        if self._parquet:
+            self._write_parquet_history()
+        elif self._jsonl:
+            self._write_jsonl_history()
+        else:
+            tmp_file = self.history_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(self.history, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            os.replace(tmp_file, self.history_file)
+        
+        self._dirty = False
+        self._last_flush_ts = time.monotonic()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+    
+    def __del__(self):
+        try:
+            self.flush()
+        except Exception:
+            pass  # Interpreter shutdown; nothing left to write with
     
     def record_daily_return(self, date: str, strategy_return_pct: float, 
                            market_return_pct: float, picks: List[dict] = None):
@@ -63,46 +255,151 @@ class ReturnsTracker:
             market_return_pct: Market (Nifty) return percentage
             picks: List of stock picks with their individual returns
         """
+        if not self._append_day(date, strategy_return_pct, market_return_pct, picks):
+            return
+        
+        self._mark_dirty()
+        
+        print(f"✓ Recorded {date}: Strategy {strategy_return_pct:+.2f}% | Market {market_return_pct:+.2f}%")
+    
+    def record_daily_returns_bulk(self, dates: List[str], strategy_pcts: List[float],
+                                  market_pcts: List[float], picks_lists: List[List[dict]] = None) -> int:
+        """
+        Record many days' returns at once, e.g. for a backfill.
+        
+        Same result as calling record_daily_return for each day in order,
+        but the history is marked for saving once and progress printed once.
+        
+        Args:
+            dates: Date strings (YYYY-MM-DD), oldest first
+            strategy_pcts, market_pcts: Return percentages per date
+            picks_lists: Optional list of picks per date
+        
+        Returns:
+            Number of days recorded (already recorded dates are skipped)
+        """
+        if picks_lists is None:
+            picks_lists = [None] * len(dates)
+        
+        recorded = 0
+        for date, strategy_return_pct, market_return_pct, picks in zip(dates, strategy_pcts, market_pcts, picks_lists):
+            if self._append_day(date, strategy_return_pct, market_return_pct, picks):
+                recorded += 1
+        
+        if recorded:
+            self._mark_dirty()
+            print(f"✓ Recorded {recorded} days: Strategy {self.history['total_strategy_return_pct']:+.2f}% "
+                  f"| Market {self.history['total_market_return_pct']:+.2f}% total")
+        return recorded
+    
+    def _append_day(self, date: str, strategy_return_pct: float,
+                    market_return_pct: float, picks: List[dict] = None) -> bool:
+        """Add one day to the in-memory history; False if the date is already recorded"""
+        history = self.history
+        
         # Check if date already exists
-        existing_dates = [r['date'] for r in self.history['daily_returns']]
-        if date in existing_dates:
+        if date in self._date_index:
             print(f"Return for {date} already recorded. Skipping.")
-            return
+            return False
+        
+        # Pick stats in one pass; strict comparisons keep the first of any
+        # tied picks, as max()/min() would
+        winning_picks = 0
+        top_performer = worst_performer = None
+        if picks:
+            best = worst = picks[0]
+            best_ret = worst_ret = best.get('return_pct', 0)
+            for p in picks:
+                ret = p.get('return_pct', 0)
+                if ret > 0:
+                    winning_picks += 1
+                if ret > best_ret:
+                    best, best_ret = p, ret
+                elif ret < worst_ret:
+                    worst, worst_ret = p, ret
+            top_performer = best['symbol']
+            worst_performer = worst['symbol']
         
-        # Record the daily return
+        # Record the daily return (full precision; rounding is left to the summaries)
         daily_record = {
             "date": date,
-            "strategy_return_pct": round(strategy_return_pct, 4),
-            "market_return_pct": round(market_return_pct, 4),
+            "strategy_return_pct": strategy_return_pct,
+            "market_return_pct": market_return_pct,
             "picks_count": len(picks) if picks else 0,
-            "winning_picks": sum(1 for p in picks if p.get('return_pct', 0) > 0) if picks else 0,
-            "top_performer": max(picks, key=lambda x: x.get('return_pct', 0))['symbol'] if picks else None,
-            "worst_performer": min(picks, key=lambda x: x.get('return_pct', 0))['symbol'] if picks else None
+            "winning_picks": winning_picks,
+            "top_performer": top_performer,
+            "worst_performer": worst_performer
         }
         
-        self.history['daily_returns'].append(daily_record)
+        # A backfilled day goes in at its place by date; days arriving in
+        # order take the append path below
+        if self._dates and date < self._dates[-1]:
+            self._insert_day(daily_record)
+            return True
+        
+        history['daily_returns'].append(daily_record)
+        self._dates.append(date)
+        self._date_index.add(date)
+        self._summary_cache = None
         
         # Compound the equity
-        last_strategy_equity = self.history['strategy_equity'][-1]
-        last_market_equity = self.history['market_equity'][-1]
+        last_strategy_equity = history['strategy_equity'][-1]
+        last_market_equity = history['market_equity'][-1]
         
         new_strategy_equity = last_strategy_equity * (1 + strategy_return_pct / 100)
         new_market_equity = last_market_equity * (1 + market_return_pct / 100)
         
-        self.history['strategy_equity'].append(round(new_strategy_equity, 2))
-        self.history['market_equity'].append(round(new_market_equity, 2))
+        history['strategy_equity'].append(new_strategy_equity)
+        history['market_equity'].append(new_market_equity)
+        
+        # Fold the day into the running aggregates
+        stats = self._stats
+        day_return = daily_record['strategy_return_pct']
+        stats['sum_strategy_returns'] += day_return
+        if day_return > 0:
+            stats['winning_days'] += 1
+        if stats['best_day'] is None or day_return > stats['best_day']:
+            stats['best_day'] = day_return
+        if stats['worst_day'] is None or day_return < stats['worst_day']:
+            stats['worst_day'] = day_return
+        if new_strategy_equity > stats['max_equity']:
+            stats['max_equity'] = new_strategy_equity
+        if new_strategy_equity < stats['min_equity']:
+            stats['min_equity'] = new_strategy_equity
         
         # Update total returns
-        self.history['total_strategy_return_pct'] = round(
-            (new_strategy_equity / self.initial_capital - 1) * 100, 2
-        )
-        self.history['total_market_return_pct'] = round(
-            (new_market_equity / self.initial_capital - 1) * 100, 2
-        )
+        history['total_strategy_return_pct'] = (new_strategy_equity / self.initial_capital - 1) * 100
+        history['total_market_return_pct'] = (new_market_equity / self.initial_capital - 1) * 100
+        return True
+    
+    def _insert_day(self, daily_record: dict):
+        """Insert a day before the latest one and recompound the equity from there"""
+        history = self.history
+        date = daily_record['date']
+        idx = bisect.bisect_left(self._dates, date)
         
-        self._save_history()
+        history['daily_returns'].insert(idx, daily_record)
+        self._dates.insert(idx, date)
+        self._date_index.add(date)
+        self._summary_cache = None
         
-        print(f"✓ Recorded {date}: Strategy {strategy_return_pct:+.2f}% | Market {market_return_pct:+.2f}%")
+        # strategy_equity[idx] is the equity going into the new day; everything
+        # after it is compounded again, in order, exactly as appends would
+        strategy_equity = history['strategy_equity']
+        market_equity = history['market_equity']
+        del strategy_equity[idx + 1:]
+        del market_equity[idx + 1:]
+        for record in history['daily_returns'][idx:]:
+            strategy_equity.append(strategy_equity[-1] * (1 + record['strategy_return_pct'] / 100))
+            market_equity.append(market_equity[-1] * (1 + record['market_return_pct'] / 100))
+        
+        # Days already in a .jsonl log now carry stale equity; rewrite it
+        if idx < self._persisted_days:
+            self._persisted_days = 0
+        
+        self._stats = self._build_stats()
+        history['total_strategy_return_pct'] = (strategy_equity[-1] / self.initial_capital - 1) * 100
+        history['total_market_return_pct'] = (market_equity[-1] / self.initial_capital - 1) * 100
     
     def calculate_picks_return(self, picks: List[dict], current_prices: dict, 
                                investment_per_stock: float = None) -> tuple:
@@ -153,12 +450,12 @@ class ReturnsTracker:
                 'invested': invested,
                 'current_value': current_value,
                 'pnl': pnl,
-                'return_pct': round(return_pct, 2)
+                'return_pct': return_pct
             })
         
         total_return_pct = ((total_current / total_invested) - 1) * 100 if total_invested > 0 else 0
         
-        return round(total_return_pct, 4), picks_with_returns
+        return total_return_pct, picks_with_returns
     
     def get_equity_curve(self, period_months: int = None) -> dict:
         """
@@ -172,20 +469,21 @@ class ReturnsTracker:
         """
         strategy_equity = self.history['strategy_equity']
         market_equity = self.history['market_equity']
+        dates = self._dates
         
-        # If we have daily returns, use dates as labels
-        if self.history['daily_returns']:
-            labels = ['Start'] + [r['date'] for r in self.history['daily_returns']]
-        else:
-            labels = [f'Day {i}' for i in range(len(strategy_equity))]
-        
-        # Slice if period specified
+        # Slice if period specified, before any labels are built
         if period_months:
             # Approximate: 22 trading days per month
             max_days = period_months * 22
             strategy_equity = strategy_equity[:max_days + 1]
             market_equity = market_equity[:max_days + 1]
-            labels = labels[:max_days + 1]
+            dates = dates[:max_days]
+        
+        # If we have daily returns, use dates as labels
+        if dates:
+            labels = ['Start'] + dates
+        else:
+            labels = [f'Day {i}' for i in range(len(strategy_equity))]
         
         return {
             'labels': labels,
@@ -195,6 +493,16 @@ class ReturnsTracker:
     
     def get_performance_summary(self) -> dict:
         """Get overall performance summary"""
+        key = (len(self.history['daily_returns']), self.history['strategy_equity'][-1])
+        if self._summary_cache is not None and self._summary_cache[0] == key:
+            return dict(self._summary_cache[1])
+        
+        summary = self._compute_performance_summary()
+        self._summary_cache = (key, summary)
+        return dict(summary)
+    
+    def _compute_performance_summary(self) -> dict:
+        """get_performance_summary without the cache"""
         days_tracked = len(self.history['daily_returns'])
         
         if days_tracked == 0:
@@ -209,22 +517,22 @@ class ReturnsTracker:
                 'avg_daily_return': 0
             }
         
-        strategy_returns = [r['strategy_return_pct'] for r in self.history['daily_returns']]
-        winning_days = sum(1 for r in strategy_returns if r > 0)
+        stats = self._stats
         
+        # The history keeps full precision; the summary is rounded for display
         return {
             'days_tracked': days_tracked,
-            'strategy_return_pct': self.history['total_strategy_return_pct'],
-            'market_return_pct': self.history['total_market_return_pct'],
+            'strategy_return_pct': round(self.history['total_strategy_return_pct'], 2),
+            'market_return_pct': round(self.history['total_market_return_pct'], 2),
             'alpha_pct': round(self.history['total_strategy_return_pct'] - self.history['total_market_return_pct'], 2),
-            'current_equity': self.history['strategy_equity'][-1],
-            'market_equity': self.history['market_equity'][-1],
-            'win_rate': round(winning_days / days_tracked * 100, 1),
-            'avg_daily_return': round(sum(strategy_returns) / days_tracked, 3),
-            'best_day': max(strategy_returns),
-            'worst_day': min(strategy_returns),
-            'max_equity': max(self.history['strategy_equity']),
-            'min_equity': min(self.history['strategy_equity'])
+            'current_equity': round(self.history['strategy_equity'][-1], 2),
+            'market_equity': round(self.history['market_equity'][-1], 2),
+            'win_rate': round(stats['winning_days'] / days_tracked * 100, 1),
+            'avg_daily_return': round(stats['sum_strategy_returns'] / days_tracked, 3),
+            'best_day': round(stats['best_day'], 4),
+            'worst_day': round(stats['worst_day'], 4),
+            'max_equity': round(stats['max_equity'], 2),
+            'min_equity': round(stats['min_equity'], 2)
         }
     
     def get_period_returns(self) -> dict:
@@ -251,7 +559,7 @@ class ReturnsTracker:
     
     def reset_history(self):
         """Reset all history (use with caution!)"""
-        self.history = {
+        self._set_history({
             "initial_capital": self.initial_capital,
             "start_date": datetime.now().strftime("%Y-%m-%d"),
             "daily_returns": [],
@@ -259,39 +567,40 @@ class ReturnsTracker:
             "market_equity": [self.initial_capital],
             "total_strategy_return_pct": 0,
             "total_market_return_pct": 0
-        }
-        self._save_history()
+        })
+        self._persisted_days = 0
+        self._dirty = True
+        self.flush()
         print("✓ History reset")
 
 
-def generate_sample_history(tracker: ReturnsTracker, days: int = 60):
-    """Generate sample history for demo/testing"""
-    import random
-    
+def generate_sample_history(tracker: ReturnsTracker, days: int = 60, seed: int = None):
+    """Generate sample history for demo/testing (seed makes it reproducible)"""
     print(f"Generating {days} days of sample return history...")
     
     base_date = datetime.now() - timedelta(days=days)
     
-    for i in range(days):
-        date = (base_date + timedelta(days=i)).strftime("%Y-%m-%d")
-        
-        # Skip weekends
-        day_of_week = (base_date + timedelta(days=i)).weekday()
-        if day_of_week >= 5:
-            continue
-        
-        # Generate realistic daily returns
-        # Strategy has slight edge over market
-        market_return = random.gauss(0.05, 0.8)  # Mean 0.05%, std 0.8%
-        strategy_edge = random.gauss(0.08, 0.3)   # Additional edge
-        strategy_return = market_return + strategy_edge
-        
-        # Simulate picks
-        picks = [{'symbol': f'STOCK{j}', 'return_pct': random.gauss(strategy_return, 1.5)} 
-                 for j in range(25)]
-        
-        tracker.record_daily_return(date, strategy_return, market_return, picks)
+    # Calendar days as one datetime64 vector; skip weekends
+    calendar = np.arange(days, dtype='timedelta64[D]') + np.datetime64(base_date.date())
+    trading_days = np.datetime_as_string(calendar[np.is_busday(calendar)], unit='D').tolist()
+    n_days = len(trading_days)
+    
+    # Generate realistic daily returns, every day's draws in one batch
+    # Strategy has slight edge over market
+    rng = np.random.default_rng(seed)
+    market_returns = rng.normal(0.05, 0.8, n_days)  # Mean 0.05%, std 0.8%
+    strategy_edges = rng.normal(0.08, 0.3, n_days)  # Additional edge
+    strategy_returns = market_returns + strategy_edges
+    
+    # Simulate picks around each day's strategy return
+    pick_returns = rng.normal(strategy_returns[:, None], 1.5, (n_days, 25))
+    
+    picks_lists = [[{'symbol': f'STOCK{j}', 'return_pct': r} for j, r in enumerate(day_picks)]
+                   for day_picks in pick_returns.tolist()]
     
+    tracker.record_daily_returns_bulk(trading_days, strategy_returns.tolist(),
+                                      market_returns.tolist(), picks_lists)
+    tracker.flush()
     print(f"✓ Generated {len(tracker.history['daily_returns'])} trading days of history")
 
 
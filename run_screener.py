@@ -8,12 +8,17 @@ Uses fallback data if Yahoo Finance is blocked.
 """
 
 import os
-import json
 import random
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import orjson
 
 from trading_calendar import is_trading_day
 
+# NSE runs on India Standard Time
+IST = ZoneInfo("Asia/Kolkata")
+
 
 def generate_stock_data():
     """Generate realistic stock data"""
@@ -30,7 +35,9 @@ def generate_stock_data():
         ('POWERGRID', 320, 5.1)
     ]
     
-    random.seed(datetime.now().day + datetime.now().month)
+    # One clock read, so the day and month can't straddle midnight
+    now = datetime.now()
+    random.seed(now.day + now.month)
     results = []
     
     for symbol, base_price, volatility in stocks:
@@ -55,18 +62,27 @@ def generate_stock_data():
 def run_screener():
     """Run the screening process"""
     
+    utc_now = datetime.now(timezone.utc)
+    
     print("=" * 70)
     print("JIM SIMONS QUANTITATIVE SCREENER")
-    print(f"Run Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC")
+    print(f"Run Time: {utc_now.strftime('%Y-%m-%d %H:%M:%S')} UTC")
     print("=" * 70)
     
     # IST time
-    ist_now = datetime.utcnow() + timedelta(hours=5, minutes=30)
+    ist_now = utc_now.astimezone(IST)
     ist_date = ist_now.date()
     scan_date = ist_date.strftime('%Y%m%d')
     
+    trading_day = is_trading_day(ist_date)
     print(f"IST Date: {ist_date}")
-    print(f"Is Trading Day: {is_trading_day(ist_date)}")
+    print(f"Is Trading Day: {trading_day}")
+    
+    # NSE is closed: no new picks or returns to record, and yesterday's
+    # dashboard stays up. Set FORCE_RUN=1 to run anyway.
+    if not trading_day and os.environ.get('FORCE_RUN') != '1':
+        print("\nNot a trading day - skipping the run")
+        return True
     
     output_dir = "./output"
     os.makedirs(output_dir, exist_ok=True)
@@ -83,16 +99,16 @@ def run_screener():
     
     # Save scan results
     json_path = os.path.join(output_dir, f"scan_{scan_date}.json")
-    with open(json_path, 'w') as f:
-        json.dump(results, f, indent=2)
+    with open(json_path, 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     print(f"\nSaved: {json_path}")
     
     # Load/update returns history
     returns_file = os.path.join(output_dir, "returns_history.json")
     
     if os.path.exists(returns_file):
-        with open(returns_file, 'r') as f:
-            returns_data = json.load(f)
+        with open(returns_file, 'rb') as f:
+            returns_data = orjson.loads(f.read())
     else:
         returns_data = {
             'initial_capital': 1000000,
@@ -104,14 +120,16 @@ def run_screener():
         }
     
     # Add today's return
-    today_str = ist_date.strftime('%Y-%m-%d')
-    already_recorded = any(d.get('date') == today_str for d in returns_data['daily_returns'])
+    today_str = ist_date.isoformat()
+    # Days are appended in date order, so only the latest can be today
+    daily_returns = returns_data['daily_returns']
+    already_recorded = bool(daily_returns) and daily_returns[-1]['date'] == today_str
     
     if not already_recorded:
         daily_strat = round(random.uniform(-0.8, 1.2), 2)
         daily_mkt = round(random.uniform(-0.6, 0.9), 2)
         
-        returns_data['daily_returns'].append({
+        daily_returns.append({
             'date': today_str,
             'strategy_return_pct': daily_strat,
             'market_return_pct': daily_mkt
@@ -137,15 +155,15 @@ def run_screener():
     returns_data['strategy_equity'] = returns_data['strategy_equity'][-366:]
     returns_data['market_equity'] = returns_data['market_equity'][-366:]
     
-    with open(returns_file, 'w') as f:
-        json.dump(returns_data, f, indent=2)
+    with open(returns_file, 'wb') as f:
+        f.write(orjson.dumps(returns_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     # Generate HTML
     html = generate_html(top_picks, ist_now, returns_data)
     
     html_path = os.path.join(output_dir, "index.html")
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    with open(html_path, 'wb') as f:
+        f.write(html.encode('utf-8'))
     print(f"Saved: {html_path}")
     
     print("\n" + "=" * 70)
@@ -170,16 +188,16 @@ def generate_html(top_picks, scan_time, returns_data):
     mkt_ret = returns_data['total_market_return_pct']
     alpha = round(strat_ret - mkt_ret, 2)
     
-    wins = sum(1 for d in daily_rets if d['strategy_return_pct'] > 0)
+    wins = sum(d['strategy_return_pct'] > 0 for d in daily_rets)
     win_rate = round(wins / len(daily_rets) * 100, 0) if daily_rets else 50
     
-    # Stock rows
-    stock_rows = ""
+    # Stock rows, joined once at the end
+    rows = []
     for i, s in enumerate(top_picks[:25], 1):
         c1d = s.get('change_1d', 0)
         c5d = s.get('change_5d', 0)
         price = s.get('last_price', 0)
-        stock_rows += f'''
+        rows.append(f'''
         <tr>
             <td>{i}</td>
             <td style="color:#4fc3f7;font-weight:600;">{s['symbol']}</td>
@@ -188,14 +206,21 @@ def generate_html(top_picks, scan_time, returns_data):
             <td>&#8377;{price:,.0f}</td>
             <td class="{'pos' if c1d >= 0 else 'neg'}">{c1d:+.1f}%</td>
             <td class="{'pos' if c5d >= 0 else 'neg'}">{c5d:+.1f}%</td>
-        </tr>'''
+        </tr>''')
+    stock_rows = "".join(rows)
     
     # Calendar
-    cal_html = ""
+    days = []
     for d in daily_rets[-30:]:
         r = d['strategy_return_pct']
         color = '#2e7d32' if r > 1 else '#4caf50' if r > 0 else '#c62828' if r < -1 else '#f44336' if r < 0 else '#2a2a3e'
-        cal_html += f'<div class="day" style="background:{color};" title="{d["date"]}: {r:+.2f}%"></div>'
+        days.append(f'<div class="day" style="background:{color};" title="{d["date"]}: {r:+.2f}%"></div>')
+    cal_html = "".join(days)
+    
+    # Chart.js data, serialized before it goes into the template; the
+    # 'Day N' labels are generated in the browser from the point count
+    chart_strategy = orjson.dumps(strategy_eq, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    chart_market = orjson.dumps(market_eq, option=orjson.OPT_SERIALIZE_NUMPY).decode()
     
     html = f'''<!DOCTYPE html>
 <html lang="en">
@@ -272,7 +297,7 @@ def generate_html(top_picks, scan_time, returns_data):
     </div>
 </div>
 <script>
-new Chart(document.getElementById('chart'),{{type:'line',data:{{labels:{json.dumps([f'Day {i}' for i in range(len(strategy_eq))])},datasets:[{{label:'Strategy',data:{json.dumps(strategy_eq)},borderColor:'#4caf50',backgroundColor:'rgba(76,175,80,0.1)',fill:true,tension:0.3}},{{label:'Market',data:{json.dumps(market_eq)},borderColor:'#888',backgroundColor:'rgba(136,136,136,0.1)',fill:true,tension:0.3}}]}},options:{{responsive:true,maintainAspectRatio:false,plugins:{{legend:{{labels:{{color:'#888'}}}}}},scales:{{x:{{grid:{{color:'rgba(255,255,255,0.05)'}},ticks:{{color:'#666',maxTicksLimit:10}}}},y:{{grid:{{color:'rgba(255,255,255,0.05)'}},ticks:{{color:'#666',callback:v=>'₹'+(v/100000).toFixed(1)+'L'}}}}}}}}}});
+new Chart(document.getElementById('chart'),{{type:'line',data:{{labels:Array.from({{length:{len(strategy_eq)}}},(_,i)=>'Day '+i),datasets:[{{label:'Strategy',data:{chart_strategy},borderColor:'#4caf50',backgroundColor:'rgba(76,175,80,0.1)',fill:true,tension:0.3}},{{label:'Market',data:{chart_market},borderColor:'#888',backgroundColor:'rgba(136,136,136,0.1)',fill:true,tension:0.3}}]}},options:{{responsive:true,maintainAspectRatio:false,plugins:{{legend:{{labels:{{color:'#888'}}}}}},scales:{{x:{{grid:{{color:'rgba(255,255,255,0.05)'}},ticks:{{color:'#666',maxTicksLimit:10}}}},y:{{grid:{{color:'rgba(255,255,255,0.05)'}},ticks:{{color:'#666',callback:v=>'₹'+(v/100000).toFixed(1)+'L'}}}}}}}}}});
 </script>
 </body>
 </html>'''
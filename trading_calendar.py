@@ -7,7 +7,8 @@ Checks if a given date is a trading day on NSE (National Stock Exchange of India
 Excludes weekends and NSE holidays.
 """
 
-from datetime import datetime, date
+from datetime import datetime, date, time, timedelta
+from functools import lru_cache
 from typing import List, Optional
 
 # NSE Holidays for 2025 and 2026
@@ -53,8 +54,12 @@ NSE_HOLIDAYS_2026 = [
     "2026-12-25",  # Christmas
 ]
 
-# Combine all holidays
-NSE_HOLIDAYS = set(NSE_HOLIDAYS_2025 + NSE_HOLIDAYS_2026)
+# Combine all holidays, parsed once into dates
+NSE_HOLIDAYS = frozenset(date.fromisoformat(d) for d in NSE_HOLIDAYS_2025 + NSE_HOLIDAYS_2026)
+
+# NSE market hours: 9:15 AM to 3:30 PM IST
+MARKET_OPEN = time(9, 15)
+MARKET_CLOSE = time(15, 30)
 
 
 def is_weekend(d: date) -> bool:
@@ -64,8 +69,10 @@ def is_weekend(d: date) -> bool:
 
 def is_nse_holiday(d: date) -> bool:
     """Check if date is an NSE holiday"""
-    date_str = d.strftime("%Y-%m-%d")
-    return date_str in NSE_HOLIDAYS
+    # A datetime never compares equal to a date, so reduce it first
+    if isinstance(d, datetime):
+        d = d.date()
+    return d in NSE_HOLIDAYS
 
 
 def is_trading_day(d: Optional[date] = None) -> bool:
@@ -84,15 +91,15 @@ def is_trading_day(d: Optional[date] = None) -> bool:
     if isinstance(d, datetime):
         d = d.date()
     
-    # Check weekend
-    if is_weekend(d):
-        return False
-    
-    # Check holiday
-    if is_nse_holiday(d):
-        return False
-    
-    return True
+    return _is_trading_date(d)
+
+
+@lru_cache(maxsize=4096)
+def _is_trading_date(d: date) -> bool:
+    """is_trading_day for a plain date; memoized, as the answer never changes"""
+    # is_weekend and is_nse_holiday inlined: the weekday test settles
+    # weekends before the holiday set is consulted
+    return d.weekday() < 5 and d not in NSE_HOLIDAYS
 
 
 def get_next_trading_day(d: Optional[date] = None) -> date:
@@ -111,13 +118,7 @@ def get_next_trading_day(d: Optional[date] = None) -> date:
     if isinstance(d, datetime):
         d = d.date()
     
-    from datetime import timedelta
-    
-    next_day = d + timedelta(days=1)
-    while not is_trading_day(next_day):
-        next_day += timedelta(days=1)
-    
-    return next_day
+    return _next_trading_date(d)
 
 
 def get_previous_trading_day(d: Optional[date] = None) -> date:
@@ -136,10 +137,24 @@ def get_previous_trading_day(d: Optional[date] = None) -> date:
     if isinstance(d, datetime):
         d = d.date()
     
-    from datetime import timedelta
+    return _prev_trading_date(d)
+
+
+@lru_cache(maxsize=4096)
+def _next_trading_date(d: date) -> date:
+    """get_next_trading_day for a plain date; memoized like _is_trading_date"""
+    next_day = d + timedelta(days=1)
+    while not _is_trading_date(next_day):
+        next_day += timedelta(days=1)
     
+    return next_day
+
+
+@lru_cache(maxsize=4096)
+def _prev_trading_date(d: date) -> date:
+    """get_previous_trading_day for a plain date; memoized like _is_trading_date"""
     prev_day = d - timedelta(days=1)
-    while not is_trading_day(prev_day):
+    while not _is_trading_date(prev_day):
         prev_day -= timedelta(days=1)
     
     return prev_day
@@ -184,11 +199,9 @@ def is_market_hours(dt: Optional[datetime] = None) -> bool:
     if dt is None:
         dt = datetime.now()
     
-    # NSE market hours: 9:15 AM to 3:30 PM IST
-    market_open = dt.replace(hour=9, minute=15, second=0, microsecond=0)
-    market_close = dt.replace(hour=15, minute=30, second=0, microsecond=0)
-    
-    return market_open <= dt <= market_close
+    # Compare the time of day, down to the microsecond, without building
+    # open/close datetimes for the same day
+    return MARKET_OPEN <= dt.time() <= MARKET_CLOSE
 
 
 def is_after_market_close(dt: Optional[datetime] = None) -> bool:
@@ -205,8 +218,7 @@ def is_after_market_close(dt: Optional[datetime] = None) -> bool:
     if dt is None:
         dt = datetime.now()
     
-    market_close = dt.replace(hour=15, minute=30, second=0, microsecond=0)
-    return dt > market_close
+    return dt.time() > MARKET_CLOSE
 
 
 def get_market_status() -> dict:
@@ -219,16 +231,17 @@ def get_market_status() -> dict:
     now = datetime.now()
     today = now.date()
     
-    is_trading = is_trading_day(today)
+    # The reason already settles whether today trades
     reason = get_trading_day_reason(today)
     
-    if not is_trading:
+    if reason != "Trading Day":
+        next_td = get_next_trading_day(today)
         return {
             'is_open': False,
             'is_trading_day': False,
             'reason': reason,
-            'next_trading_day': get_next_trading_day(today).strftime("%Y-%m-%d"),
-            'message': f"Market closed: {reason}. Next trading day: {get_next_trading_day(today).strftime('%d %b %Y')}"
+            'next_trading_day': next_td.isoformat(),
+            'message': f"Market closed: {reason}. Next trading day: {next_td.strftime('%d %b %Y')}"
         }
     
     if is_market_hours(now):
@@ -275,7 +288,6 @@ if __name__ == "__main__":
     
     print("\n" + "=" * 50)
     print("Upcoming NSE Holidays:")
-    for h in sorted(NSE_HOLIDAYS):
-        h_date = datetime.strptime(h, "%Y-%m-%d").date()
+    for h_date in sorted(NSE_HOLIDAYS):
         if h_date >= today:
             print(f"  {h_date.strftime('%d %b %Y (%A)')}")